@@ -1,7 +1,7 @@
 """Website detection agent for checking if businesses have websites."""
 
 import logging
-from typing import List
+from typing import Dict, List
 from src.models.business import Business
 from src.services.website_checker import WebsiteCheckerService
 
@@ -66,9 +66,21 @@ class WebsiteDetectionAgent:
         
         updated_businesses = []
         
+        # Businesses sharing a website URL (e.g. franchise locations) are checked once
+        checked_urls: Dict[str, bool] = {}
+        
         for business in businesses:
             try:
-                updated_business = self.detect_website(business)
+                url_key = (business.website_url or '').strip()
+                if url_key in checked_urls:
+                    logger.debug(f"Reusing website check result for {url_key}")
+                    updated_business = business.model_copy(
+                        update={'has_website': checked_urls[url_key]}
+                    )
+                else:
+                    updated_business = self.detect_website(business)
+                    if url_key:
+                        checked_urls[url_key] = updated_business.has_website
                 updated_businesses.append(updated_business)
             except Exception as e:
                 logger.error(
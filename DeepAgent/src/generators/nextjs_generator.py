@@ -1,5 +1,6 @@
 """Next.js site generator for creating complete Next.js websites from business data."""
 
+import functools
 import logging
 import re
 from pathlib import Path
@@ -21,6 +22,22 @@ import shutil
 
 logger = logging.getLogger(__name__)
 
+# Single-pass escape table for JS/TS string literals (carriage returns are dropped)
+_JS_ESCAPE = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    "'": "\\'",
+    '\n': '\\n',
+    '\r': None,
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_js_text(text: str) -> str:
+    """Escape a string for JS/TS literals (cached: the same values recur across templates)."""
+    # Backslashes, quotes and newlines are escaped in one pass
+    return text.translate(_JS_ESCAPE)
+
 
 class NextJSGenerator:
     """Generator for creating complete Next.js websites."""
@@ -585,11 +602,4 @@ class NextJSGenerator:
         if not text:
             return ''
 
-        # Escape backslash first, then quotes, then newlines
-        text = text.replace('\\', '\\\\')
-        text = text.replace('"', '\\"')
-        text = text.replace("'", "\\'")
-        text = text.replace('\n', '\\n')
-        text = text.replace('\r', '')
-
-        return text
+        return _escape_js_text(text)
@@ -1,19 +1,332 @@
 """Content generation service for creating website content using LLM."""
 
-import json
+import copy
+import functools
+import hashlib
 import logging
 import re
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+import orjson
 from langchain_openai import ChatOpenAI
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
-from src.models.business import WebsiteRequirements
+from src.models.business import Business, WebsiteRequirements
 from src.utils.config import Config
 
 
 logger = logging.getLogger(__name__)
 
+# Transient OpenAI errors (429, 5xx, network) worth retrying before falling back to defaults
+_RETRYABLE_LLM_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+# In-flight LLM generations keyed by prompt hash, shared by every service instance
+# so concurrent jobs with an identical prompt wait on one call instead of each firing
+_inflight_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+
+# Current year for copyright text, re-read from the clock at most once an hour
+_YEAR_REFRESH_SECONDS = 3600
+_cached_year = datetime.now().year
+_cached_year_at = time.monotonic()
+
+# Sections produced by the separate design prompt rather than the content prompt
+_DESIGN_SECTIONS = ('design_theme', 'image_keywords')
+
+# Static part of the content prompt. Kept byte-identical across calls and placed
+# before any business-specific data so provider-side prompt caching can reuse it.
+_CONTENT_PROMPT_INSTRUCTIONS = """You are a professional website content writer creating content for a local business.
+
+Generate comprehensive website content for the business described at the end of this prompt, including:
+
+1. **Business Description and Tagline**:
+   - Create a 2-3 paragraph engaging business description that highlights the business's expertise, location, and value proposition
+   - Create a short, memorable tagline (10-15 words) that captures the essence of the business
+
+2. **About Page Content**:
+   - Title for the about page
+   - Main description (2-3 paragraphs) about the business, its mission, and what makes it unique
+   - Company history/story (1-2 paragraphs) - create a compelling narrative
+   - List of 3-5 company values or principles
+
+3. **Service Descriptions**:
+   For each service in the primary services list, create:
+   - Service name
+   - Detailed description (1-2 paragraphs) that is benefit-focused and engaging
+   - List of 3-5 key features or benefits for that service
+
+4. **SEO Meta Tags**:
+   - Meta title (50-60 characters, SEO-optimized, include location and primary service)
+   - Meta description (150-160 characters, compelling and keyword-rich)
+   - Meta keywords (list of 5-10 relevant keywords, include location-based keywords)
+   - Open Graph title (for social media sharing)
+   - Open Graph description (for social media sharing)
+   - Do NOT use apostrophes or single quotes (') in meta_title, meta_description, og_title, or og_description. These values are embedded in code. Use alternatives instead (e.g. "we have" not "we've", "premier" or "top" instead of "Austin's").
+
+5. **Call-to-Action Phrases**:
+   Generate 5-7 action-oriented CTA phrases appropriate for this industry and business type.
+   Make them compelling and varied (e.g., "Get Your Free Quote Today", "Schedule Your Consultation", etc.)
+
+6. **Testimonials Section** (if include_testimonials is True):
+   - Section title
+   - Section subtitle/description
+
+7. **Contact Section**:
+   - Contact form title
+   - Contact form description
+   - Formatted phone number for display
+   - Formatted address for display
+
+8. **Footer Content**:
+   - Footer description (brief, 1-2 sentences)
+   - Copyright text (include current year)
+
+**Content Guidelines**:
+- All content should match the brand tone given in the requirements
+- Incorporate SEO keywords naturally (avoid keyword stuffing)
+- Make content engaging, professional, and optimized for local SEO
+- Use competitor insights as inspiration, but create original content (do not copy)
+- Focus on benefits and value proposition
+- Make content location-aware (mention city/state naturally)
+- Ensure all content is original and tailored to this specific business
+- In all SEO/meta fields (meta_title, meta_description, og_title, og_description), avoid apostrophes and single quotes so the text can be safely embedded in code
+
+Return your response as a JSON object with the following structure:
+{
+    "business_info": {
+        "name": "Business Name",
+        "description": "2-3 paragraph business description...",
+        "tagline": "Short memorable tagline"
+    },
+    "about_content": {
+        "title": "About Page Title",
+        "description": "About page main content...",
+        "history": "Company history/story...",
+        "values": ["Value 1", "Value 2", "Value 3"]
+    },
+    "services": [
+        {
+            "name": "Service Name",
+            "description": "Service description...",
+            "features": ["Feature 1", "Feature 2", "Feature 3"]
+        }
+    ],
+    "seo": {
+        "meta_title": "SEO-optimized title",
+        "meta_description": "SEO-optimized description",
+        "meta_keywords": ["keyword1", "keyword2"],
+        "og_title": "OG title",
+        "og_description": "OG description"
+    },
+    "call_to_actions": ["CTA 1", "CTA 2", "CTA 3"],
+    "testimonials_section": {
+        "title": "Testimonials Title",
+        "subtitle": "Testimonials Subtitle"
+    },
+    "contact": {
+        "form_title": "Contact Form Title",
+        "form_description": "Contact form description",
+        "phone_display": "Formatted phone",
+        "address_display": "Formatted address"
+    },
+    "footer": {
+        "description": "Footer description",
+        "copyright_text": "Copyright text with year"
+    }
+}
+"""
+
+# Static part of the design prompt (see _CONTENT_PROMPT_INSTRUCTIONS)
+_DESIGN_PROMPT_INSTRUCTIONS = """You are a professional web designer choosing the visual direction for a local business website.
+
+Generate, for the business described at the end of this prompt:
+
+1. **Design Theme** (so each website looks unique and premium):
+   - theme_name: A short name (e.g. "Modern Minimal", "Bold Corporate", "Warm Professional", "Dark Elegant", "Fresh Clean")
+   - color_palette: Object with hex codes: primary (main brand, e.g. #0f766e), secondary (e.g. #0d9488), accent (highlight, e.g. #f59e0b), background (page bg, e.g. #f8fafc), text (main text, e.g. #1e293b), text_muted (e.g. #64748b). Choose a distinct palette that fits the industry and feels premium.
+   - font_heading: One Google Font name for headings (e.g. "Playfair Display", "Clash Display", "Outfit", "Sora", "DM Serif Display", "Plus Jakarta Sans"). Pick something that feels premium and distinct.
+   - font_body: One Google Font name for body text (e.g. "Inter", "Source Sans 3", "DM Sans", "Outfit", "Manrope"). Must pair well with font_heading.
+   - layout_style: One of "hero-centered", "hero-split", "hero-full-image", "card-heavy", "minimal-stripes". Determines hero and section layout.
+
+2. **Image Keywords** (for fetching or generating relevant images):
+   - hero: 2-3 search keywords for the main hero/header image (e.g. "professional roofing team", "residential roof repair")
+   - about: 2-3 keywords for about section image (e.g. "local business team", "contractor at work")
+   - services: For each service listed in the business information, add 1-2 keywords (e.g. "roof installation", "commercial roofing"). Return as a list of strings, one entry per service in the same order.
+   Use concrete, industry-specific terms so images are relevant to the business.
+
+Return your response as a JSON object with the following structure:
+{
+    "design_theme": {
+        "theme_name": "Short theme name",
+        "color_palette": {
+            "primary": "#hex",
+            "secondary": "#hex",
+            "accent": "#hex",
+            "background": "#hex",
+            "text": "#hex",
+            "text_muted": "#hex"
+        },
+        "font_heading": "Google Font name",
+        "font_body": "Google Font name",
+        "layout_style": "hero-centered|hero-split|hero-full-image|card-heavy|minimal-stripes"
+    },
+    "image_keywords": {
+        "hero": ["keyword1", "keyword2"],
+        "about": ["keyword1", "keyword2"],
+        "services": ["service1 keyword", "service2 keyword"]
+    }
+}
+"""
+
+# Top-level content sections and the empty container each one defaults to
+_CONTENT_SECTIONS = (
+    ('business_info', dict),
+    ('about_content', dict),
+    ('services', list),
+    ('seo', dict),
+    ('call_to_actions', list),
+    ('testimonials_section', dict),
+    ('contact', dict),
+    ('footer', dict),
+    ('design_theme', dict),
+    ('image_keywords', dict),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_llm(model: str, api_key: str, temperature: float) -> ChatOpenAI:
+    """
+    Return a shared ChatOpenAI client for the given settings.
+    
+    Services created per request reuse the same client, and with it the
+    underlying HTTP connection pool, instead of opening new connections.
+    SDK retries are disabled: _invoke_llm is the only retry layer.
+    """
+    logger.info("Initializing OpenAI LLM with model: %s", model)
+    return ChatOpenAI(
+        api_key=api_key,
+        model=model,
+        temperature=temperature,
+        max_retries=0
+    )
+
+
+def _format_location(business: Business) -> str:
+    """Format a business location as "City, ST", or just the city when state is unknown."""
+    return f"{business.city}, {business.state}" if business.state else business.city
+
+
+def _current_year() -> int:
+    """Return the current year, refreshing the cached value at most once an hour."""
+    global _cached_year, _cached_year_at
+    now = time.monotonic()
+    if now - _cached_year_at > _YEAR_REFRESH_SECONDS:
+        _cached_year = datetime.now().year
+        _cached_year_at = now
+    return _cached_year
+
+
+def _or_na(items: Optional[List[str]]) -> str:
+    """Join items for a prompt line, or return 'N/A' when there are none."""
+    return ', '.join(items) if items else 'N/A'
+
+
+def _fill_default(section: Dict[str, Any], key: str, factory: Callable[[], Any]) -> None:
+    """
+    Set a default value only when the key is missing or empty.
+    
+    The factory is only called when needed, so default strings are not
+    built when the LLM already provided the value.
+    """
+    if not section.get(key):
+        section[key] = factory()
+
+
+class _TopLevelJSONScanner:
+    """
+    Incremental scanner that emits top-level members of a streamed JSON object.
+    
+    Text before the opening brace (e.g. a markdown code fence) is ignored.
+    Each member is parsed as soon as the comma or closing brace that ends it
+    arrives, so callers can use early sections before the response finishes.
+    """
+    
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.done = False
+    
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Feed a chunk of streamed text.
+        
+        Args:
+            text: Next chunk of LLM output.
+            
+        Returns:
+            List of (key, value) tuples for members completed by this chunk.
+        """
+        completed = []
+        for char in text:
+            if self.done:
+                break
+            if self._depth == 0:
+                # Skip anything before the root object starts
+                if char == '{':
+                    self._depth = 1
+                continue
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+                    completed.extend(self._flush())
+                    continue
+            elif char == ',' and self._depth == 1:
+                completed.extend(self._flush())
+                continue
+            
+            self._member.append(char)
+        return completed
+    
+    def _flush(self) -> List[Tuple[str, Any]]:
+        """Parse the buffered member text, if any, into (key, value) tuples."""
+        member_text = ''.join(self._member).strip()
+        self._member = []
+        if not member_text:
+            return []
+        return list(orjson.loads('{' + member_text + '}').items())
+
 
 class ContentGeneratorService:
     """Service that generates website content using LLM."""
@@ -31,8 +344,9 @@ class ContentGeneratorService:
         self.llm = self._initialize_llm()
         
         logger.info(
-            f"ContentGeneratorService initialized with LLM provider: "
-            f"{config.llm_provider}, model: {config.llm_model}"
+            "ContentGeneratorService initialized with LLM provider: %s, model: %s",
+            config.llm_provider,
+            config.llm_model
         )
     
     def _initialize_llm(self):
@@ -46,11 +360,10 @@ class ContentGeneratorService:
             if not self.config.openai_api_key:
                 raise ValueError("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
             
-            logger.info(f"Initializing OpenAI LLM with model: {self.config.llm_model}")
-            return ChatOpenAI(
-                api_key=self.config.openai_api_key,
-                model=self.config.llm_model,
-                temperature=0.7  # Higher temperature for more creative content generation
+            return _get_llm(
+                self.config.llm_model,
+                self.config.openai_api_key,
+                0.7  # Higher temperature for more creative content generation
             )
         
         else:
@@ -81,36 +394,121 @@ class ContentGeneratorService:
             - footer: description, copyright_text
         """
         logger.info(
-            f"Starting website content generation for business: {requirements.business.name}"
+            "Starting website content generation for business: %s",
+            requirements.business.name
         )
         
         try:
-            # Create comprehensive prompt
-            prompt = self._create_content_generation_prompt(requirements)
+            content_prompt = self._create_content_generation_prompt(requirements)
+            design_prompt = self._create_design_prompt(requirements)
+            
+            # Generate design in parallel with the (longer) written content
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                design_future = executor.submit(self._generate_with_llm, design_prompt)
+                content_json = self._generate_with_llm(content_prompt)
+                
+                if content_json is None:
+                    logger.warning("Falling back to default content")
+                    return self._create_default_content(requirements)
+                
+                design_json = design_future.result()
+            finally:
+                # Never wait for a design result the fallback does not use
+                executor.shutdown(wait=False, cancel_futures=True)
             
-            # Generate content using LLM
-            content = self._generate_with_llm(prompt, requirements)
+            content = self._merge_design(content_json, design_json)
+            content = self._validate_and_enhance_content(content, requirements)
             
             logger.info(
-                f"Successfully generated website content for {requirements.business.name}"
+                "Successfully generated website content for %s",
+                requirements.business.name
             )
             
             return content
             
         except Exception as e:
             logger.error(
-                f"Error generating website content: {str(e)}",
+                "Error generating website content: %s",
+                e,
                 exc_info=True
             )
             # Return partial content with defaults
             return self._create_default_content(requirements)
     
+    def generate_website_content_stream(
+        self,
+        requirements: WebsiteRequirements
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate website content, yielding each top-level section as it completes.
+        
+        Streams the LLM response so callers can render early sections (e.g.
+        business_info) while later ones are still being generated. Sections
+        the LLM omitted are yielded at the end with defaults applied; on any
+        error the remaining sections come from the default content.
+        
+        Args:
+            requirements: WebsiteRequirements object with business info and requirements.
+            
+        Yields:
+            (section_name, section_value) tuples, using the same sections as
+            generate_website_content.
+        """
+        logger.info(
+            "Starting streamed website content generation for business: %s",
+            requirements.business.name
+        )
+        
+        streamed: Dict[str, Any] = {}
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            content_prompt = self._create_content_generation_prompt(requirements)
+            design_future = executor.submit(
+                self._generate_with_llm, self._create_design_prompt(requirements)
+            )
+            scanner = _TopLevelJSONScanner()
+            
+            for chunk in self.llm.stream(content_prompt):
+                chunk_text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+                for section, value in scanner.feed(chunk_text):
+                    streamed[section] = value
+                    yield section, value
+                if scanner.done:
+                    break
+            
+            # Validate a copy so sections already handed to the caller are not mutated
+            content = self._merge_design(copy.deepcopy(streamed), design_future.result())
+            content = self._validate_and_enhance_content(content, requirements)
+            
+            logger.info(
+                "Successfully streamed website content for %s",
+                requirements.business.name
+            )
+            
+        except Exception as e:
+            logger.error(
+                "Error streaming website content: %s",
+                e,
+                exc_info=True
+            )
+            logger.warning("Falling back to default content for remaining sections")
+            content = self._create_default_content(requirements)
+        finally:
+            # Never wait for a design result the fallback does not use
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Yield sections that were filled in by defaults rather than streamed
+        for section, value in content.items():
+            if section not in streamed:
+                yield section, value
+    
     def _create_content_generation_prompt(
         self,
         requirements: WebsiteRequirements
     ) -> str:
         """
-        Create comprehensive prompt for content generation.
+        Create prompt for the written website content (everything except design).
         
         Args:
             requirements: WebsiteRequirements object.
@@ -137,20 +535,37 @@ Business Information:
         # Build competitor insights section (if available)
         competitor_section = ""
         if competitor_analysis:
+            # Cap each list so wide competitor scrapes do not bloat the prompt
+            max_items = self.config.content_generation_max_competitor_items
+            key_services = competitor_analysis.key_services[:max_items]
+            seo_keywords = competitor_analysis.seo_keywords[:max_items]
+            messaging_themes = competitor_analysis.messaging_themes[:max_items]
+            call_to_actions = competitor_analysis.call_to_actions[:max_items]
+            
+            logger.info(
+                "Including competitor insights in prompt: %d services, %d keywords, "
+                "%d themes, %d CTAs (max %d each)",
+                len(key_services),
+                len(seo_keywords),
+                len(messaging_themes),
+                len(call_to_actions),
+                max_items
+            )
+            
             competitor_section = f"""
 Competitor Insights:
-- Key Services: {', '.join(competitor_analysis.key_services) if competitor_analysis.key_services else 'N/A'}
-- SEO Keywords: {', '.join(competitor_analysis.seo_keywords) if competitor_analysis.seo_keywords else 'N/A'}
-- Messaging Themes: {', '.join(competitor_analysis.messaging_themes) if competitor_analysis.messaging_themes else 'N/A'}
-- CTAs: {', '.join(competitor_analysis.call_to_actions) if competitor_analysis.call_to_actions else 'N/A'}
+- Key Services: {_or_na(key_services)}
+- SEO Keywords: {_or_na(seo_keywords)}
+- Messaging Themes: {_or_na(messaging_themes)}
+- CTAs: {_or_na(call_to_actions)}
 """
         
         # Build requirements section
         requirements_section = f"""
 Requirements:
 - Brand Tone: {requirements.brand_tone or 'professional'}
-- Primary Services: {', '.join(requirements.primary_services) if requirements.primary_services else 'N/A'}
-- SEO Keywords: {', '.join(requirements.seo_focus_keywords) if requirements.seo_focus_keywords else 'N/A'}
+- Primary Services: {_or_na(requirements.primary_services)}
+- SEO Keywords: {_or_na(requirements.seo_focus_keywords)}
 - Target Audience: {requirements.target_audience or 'General public'}
 - Include Contact Form: {requirements.include_contact_form}
 - Include Testimonials: {requirements.include_testimonials}
@@ -160,167 +575,100 @@ Requirements:
         if requirements.generation_notes:
             requirements_section += f"- Additional Notes: {requirements.generation_notes}\n"
         
-        # Create comprehensive prompt
-        prompt = f"""You are a professional website content writer creating content for a {business.industry} business.
-
-{business_info}
-{competitor_section}
-{requirements_section}
-
-Generate comprehensive website content including:
-
-1. **Business Description and Tagline**:
-   - Create a 2-3 paragraph engaging business description that highlights the business's expertise, location, and value proposition
-   - Create a short, memorable tagline (10-15 words) that captures the essence of the business
-
-2. **About Page Content**:
-   - Title for the about page
-   - Main description (2-3 paragraphs) about the business, its mission, and what makes it unique
-   - Company history/story (1-2 paragraphs) - create a compelling narrative
-   - List of 3-5 company values or principles
-
-3. **Service Descriptions**:
-   For each service in the primary services list, create:
-   - Service name
-   - Detailed description (1-2 paragraphs) that is benefit-focused and engaging
-   - List of 3-5 key features or benefits for that service
-
-4. **SEO Meta Tags**:
-   - Meta title (50-60 characters, SEO-optimized, include location and primary service)
-   - Meta description (150-160 characters, compelling and keyword-rich)
-   - Meta keywords (list of 5-10 relevant keywords, include location-based keywords)
-   - Open Graph title (for social media sharing)
-   - Open Graph description (for social media sharing)
-   - Do NOT use apostrophes or single quotes (') in meta_title, meta_description, og_title, or og_description. These values are embedded in code. Use alternatives instead (e.g. "we have" not "we've", "premier" or "top" instead of "Austin's").
-
-5. **Call-to-Action Phrases**:
-   Generate 5-7 action-oriented CTA phrases appropriate for this industry and business type.
-   Make them compelling and varied (e.g., "Get Your Free Quote Today", "Schedule Your Consultation", etc.)
-
-6. **Testimonials Section** (if include_testimonials is True):
-   - Section title
-   - Section subtitle/description
-
-7. **Contact Section**:
-   - Contact form title
-   - Contact form description
-   - Formatted phone number for display
-   - Formatted address for display
-
-8. **Footer Content**:
-   - Footer description (brief, 1-2 sentences)
-   - Copyright text (include current year)
-
-9. **Design Theme** (so each website looks unique and premium):
-   - theme_name: A short name (e.g. "Modern Minimal", "Bold Corporate", "Warm Professional", "Dark Elegant", "Fresh Clean")
-   - color_palette: Object with hex codes: primary (main brand, e.g. #0f766e), secondary (e.g. #0d9488), accent (highlight, e.g. #f59e0b), background (page bg, e.g. #f8fafc), text (main text, e.g. #1e293b), text_muted (e.g. #64748b). Choose a distinct palette that fits the industry and feels premium.
-   - font_heading: One Google Font name for headings (e.g. "Playfair Display", "Clash Display", "Outfit", "Sora", "DM Serif Display", "Plus Jakarta Sans"). Pick something that feels premium and distinct.
-   - font_body: One Google Font name for body text (e.g. "Inter", "Source Sans 3", "DM Sans", "Outfit", "Manrope"). Must pair well with font_heading.
-   - layout_style: One of "hero-centered", "hero-split", "hero-full-image", "card-heavy", "minimal-stripes". Determines hero and section layout.
-
-10. **Image Keywords** (for fetching or generating relevant images):
-   - hero: 2-3 search keywords for the main hero/header image (e.g. "professional roofing team", "residential roof repair")
-   - about: 2-3 keywords for about section image (e.g. "local business team", "contractor at work")
-   - services: For each service in the services list, add 1-2 keywords (e.g. "roof installation", "commercial roofing"). Return as a list of strings, one entry per service in the same order as the services array.
-   Use concrete, industry-specific terms so images are relevant to the business.
-
-**Content Guidelines**:
-- All content should match the brand tone: {requirements.brand_tone or 'professional'}
-- Incorporate SEO keywords naturally (avoid keyword stuffing)
-- Make content engaging, professional, and optimized for local SEO
-- Use competitor insights as inspiration, but create original content (do not copy)
-- Focus on benefits and value proposition
-- Make content location-aware (mention city/state naturally)
-- Ensure all content is original and tailored to this specific business
-- In all SEO/meta fields (meta_title, meta_description, og_title, og_description), avoid apostrophes and single quotes so the text can be safely embedded in code
-
-Return your response as a JSON object with the following structure:
-{{
-    "business_info": {{
-        "name": "Business Name",
-        "description": "2-3 paragraph business description...",
-        "tagline": "Short memorable tagline"
-    }},
-    "about_content": {{
-        "title": "About Page Title",
-        "description": "About page main content...",
-        "history": "Company history/story...",
-        "values": ["Value 1", "Value 2", "Value 3"]
-    }},
-    "services": [
-        {{
-            "name": "Service Name",
-            "description": "Service description...",
-            "features": ["Feature 1", "Feature 2", "Feature 3"]
-        }}
-    ],
-    "seo": {{
-        "meta_title": "SEO-optimized title",
-        "meta_description": "SEO-optimized description",
-        "meta_keywords": ["keyword1", "keyword2"],
-        "og_title": "OG title",
-        "og_description": "OG description"
-    }},
-    "call_to_actions": ["CTA 1", "CTA 2", "CTA 3"],
-    "testimonials_section": {{
-        "title": "Testimonials Title",
-        "subtitle": "Testimonials Subtitle"
-    }},
-    "contact": {{
-        "form_title": "Contact Form Title",
-        "form_description": "Contact form description",
-        "phone_display": "Formatted phone",
-        "address_display": "Formatted address"
-    }},
-    "footer": {{
-        "description": "Footer description",
-        "copyright_text": "Copyright text with year"
-    }},
-    "design_theme": {{
-        "theme_name": "Short theme name",
-        "color_palette": {{
-            "primary": "#hex",
-            "secondary": "#hex",
-            "accent": "#hex",
-            "background": "#hex",
-            "text": "#hex",
-            "text_muted": "#hex"
-        }},
-        "font_heading": "Google Font name",
-        "font_body": "Google Font name",
-        "layout_style": "hero-centered|hero-split|hero-full-image|card-heavy|minimal-stripes"
-    }},
-    "image_keywords": {{
-        "hero": ["keyword1", "keyword2"],
-        "about": ["keyword1", "keyword2"],
-        "services": ["service1 keyword", "service2 keyword"]
-    }}
-}}
-"""
+        # Static instructions first so the prompt prefix is identical across businesses
+        # (lets provider-side prompt caching reuse it); business-specific data goes last
+        prompt = (
+            f"{_CONTENT_PROMPT_INSTRUCTIONS}\n"
+            f"Write the content for this {business.industry} business:\n"
+            f"{business_info}{competitor_section}{requirements_section}"
+        )
         
         return prompt
     
-    def _generate_with_llm(
+    def _create_design_prompt(
         self,
-        prompt: str,
         requirements: WebsiteRequirements
-    ) -> Dict[str, Any]:
+    ) -> str:
+        """
+        Create prompt for the design theme and image keywords.
+        
+        These sections do not depend on the written content, so they are
+        generated by a separate, smaller LLM call that runs concurrently.
+        
+        Args:
+            requirements: WebsiteRequirements object.
+            
+        Returns:
+            Formatted prompt string.
         """
-        Call LLM with prompt and return structured content.
+        business = requirements.business
+        
+        prompt = (
+            f"{_DESIGN_PROMPT_INSTRUCTIONS}\n"
+            "Business Information:\n"
+            f"- Name: {business.name}\n"
+            f"- Location: {_format_location(business)}\n"
+            f"- Industry: {business.industry}\n"
+            f"- Brand Tone: {requirements.brand_tone or 'professional'}\n"
+            f"- Services: {_or_na(requirements.primary_services)}\n"
+        )
+        
+        return prompt
+    
+    def _generate_with_llm(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Generate JSON for a prompt, sharing the result of an identical in-flight call.
+        
+        If another thread is already generating for the same prompt, wait for
+        its result and return a copy instead of calling the LLM again.
+        
+        Args:
+            prompt: Content generation prompt.
+            
+        Returns:
+            Parsed JSON dictionary, or None if the LLM call or parsing failed.
+        """
+        key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _inflight[key] = future
+        
+        if not is_leader:
+            logger.info("Identical content generation already in progress, waiting for its result")
+            return copy.deepcopy(future.result())
+        
+        try:
+            content = self._call_llm_for_json(prompt)
+            # Hand waiters a snapshot so later edits by this caller do not leak to them
+            future.set_result(copy.deepcopy(content))
+            return content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    
+    def _call_llm_for_json(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Call LLM with prompt and parse the JSON object from its response.
         
         Args:
             prompt: Content generation prompt.
-            requirements: WebsiteRequirements for fallback/defaults.
             
         Returns:
-            Dictionary with structured content.
+            Parsed JSON dictionary, or None if the LLM call or parsing failed.
         """
         logger.info("Calling LLM for content generation")
         
         try:
             # Use JSON mode for structured output
             # Note: We'll parse JSON from the response
-            response = self.llm.invoke(prompt)
+            response = self._invoke_llm(prompt)
             
             # Extract content from response
             content_text = response.content if hasattr(response, 'content') else str(response)
@@ -328,32 +676,72 @@ Return your response as a JSON object with the following structure:
             # Try to extract JSON from the response (handle markdown code blocks)
             json_match = re.search(r'\{.*\}', content_text, re.DOTALL)
             if json_match:
-                content_json = json.loads(json_match.group())
+                content_json = orjson.loads(json_match.group())
             else:
                 # Try parsing the whole response
-                content_json = json.loads(content_text)
-            
-            # Validate and enhance the content
-            content = self._validate_and_enhance_content(content_json, requirements)
+                content_json = orjson.loads(content_text)
             
             logger.info("Successfully generated content from LLM")
-            return content
+            return content_json
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
-                f"Error parsing JSON from LLM response: {str(e)}",
+                "Error parsing JSON from LLM response: %s",
+                e,
                 exc_info=True
             )
-            logger.warning("Falling back to default content")
-            return self._create_default_content(requirements)
+            return None
             
         except Exception as e:
             logger.error(
-                f"Error calling LLM for content generation: {str(e)}",
+                "Error calling LLM for content generation: %s",
+                e,
                 exc_info=True
             )
-            logger.warning("Falling back to default content")
-            return self._create_default_content(requirements)
+            return None
+    
+    @retry(
+        retry=retry_if_exception_type(_RETRYABLE_LLM_ERRORS),
+        wait=wait_exponential_jitter(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    def _invoke_llm(self, prompt: str):
+        """
+        Invoke the LLM, retrying transient API errors with exponential backoff.
+        
+        Args:
+            prompt: Content generation prompt.
+            
+        Returns:
+            Raw LLM response.
+        """
+        return self.llm.invoke(prompt)
+    
+    def _merge_design(
+        self,
+        content: Dict[str, Any],
+        design: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge the design call's sections into the generated content.
+        
+        Args:
+            content: Content dictionary from the content prompt.
+            design: JSON from the design prompt, or None if that call failed.
+            
+        Returns:
+            Content dictionary including design_theme and image_keywords when available.
+        """
+        if design is None:
+            logger.warning("Design generation failed, using default design theme and image keywords")
+            return content
+        
+        for section in _DESIGN_SECTIONS:
+            if section in design:
+                content[section] = design[section]
+        return content
     
     def _validate_and_enhance_content(
         self,
@@ -371,74 +759,52 @@ Return your response as a JSON object with the following structure:
             Validated and enhanced content dictionary.
         """
         business = requirements.business
-        current_year = datetime.now().year
-        
-        # Ensure all required sections exist
-        if 'business_info' not in content:
-            content['business_info'] = {}
-        
-        if 'about_content' not in content:
-            content['about_content'] = {}
-        
-        if 'services' not in content:
-            content['services'] = []
-        
-        if 'seo' not in content:
-            content['seo'] = {}
-        
-        if 'call_to_actions' not in content:
-            content['call_to_actions'] = []
-        
-        if 'testimonials_section' not in content:
-            content['testimonials_section'] = {}
-        
-        if 'contact' not in content:
-            content['contact'] = {}
-        
-        if 'footer' not in content:
-            content['footer'] = {}
-        
-        if 'design_theme' not in content:
-            content['design_theme'] = {}
+        location = _format_location(business)
         
-        if 'image_keywords' not in content:
-            content['image_keywords'] = {}
+        # Ensure all required sections exist (only build containers that are missing)
+        for section, factory in _CONTENT_SECTIONS:
+            if section not in content:
+                content[section] = factory()
         
         # Set defaults for business_info (fill when missing or empty so home page always has content)
-        if 'name' not in content['business_info'] or not content['business_info'].get('name'):
-            content['business_info']['name'] = business.name
-
-        default_description = (
-            f"{business.name} is a {business.industry} business "
-            f"located in {business.city}, {business.state or ''}. "
-            f"We provide quality services to our customers."
+        business_info = content['business_info']
+        _fill_default(business_info, 'name', lambda: business.name)
+        _fill_default(
+            business_info,
+            'description',
+            lambda: (
+                f"{business.name} is a {business.industry} business "
+                f"located in {location}. "
+                f"We provide quality services to our customers."
+            )
         )
-        if not content['business_info'].get('description'):
-            content['business_info']['description'] = default_description
-
-        default_tagline = (
-            f"Quality {business.industry} services in {business.city}"
+        _fill_default(
+            business_info,
+            'tagline',
+            lambda: f"Quality {business.industry} services in {business.city}"
         )
-        if not content['business_info'].get('tagline'):
-            content['business_info']['tagline'] = default_tagline
         
         # Set defaults for about_content (so home/about sections always have content)
-        if 'title' not in content['about_content'] or not content['about_content'].get('title'):
-            content['about_content']['title'] = f"About {business.name}"
-        if not content['about_content'].get('description'):
-            content['about_content']['description'] = (
-                f"{business.name} has been serving the {business.city}"
-                f"{', ' + business.state if business.state else ''} area with reliable {business.industry} services. "
+        about_content = content['about_content']
+        _fill_default(about_content, 'title', lambda: f"About {business.name}")
+        _fill_default(
+            about_content,
+            'description',
+            lambda: (
+                f"{business.name} has been serving the {location} "
+                f"area with reliable {business.industry} services. "
                 "We focus on quality, transparency, and customer satisfaction on every job."
             )
-        if 'values' not in content['about_content'] or not content['about_content'].get('values'):
-            content['about_content']['values'] = ['Quality', 'Integrity', 'Customer Service']
+        )
+        _fill_default(about_content, 'values', lambda: ['Quality', 'Integrity', 'Customer Service'])
         
         # Ensure services match primary_services
         if requirements.primary_services:
             # If services were generated, keep them; otherwise create defaults
-            if not content['services']:
-                content['services'] = [
+            _fill_default(
+                content,
+                'services',
+                lambda: [
                     {
                         'name': service,
                         'description': f"Professional {service.lower()} services.",
@@ -446,71 +812,69 @@ Return your response as a JSON object with the following structure:
                     }
                     for service in requirements.primary_services
                 ]
+            )
         
         # Set defaults for SEO
-        if 'meta_title' not in content['seo']:
-            location = f"{business.city}, {business.state or ''}".strip()
-            content['seo']['meta_title'] = (
+        seo = content['seo']
+        if 'meta_title' not in seo:
+            seo['meta_title'] = (
                 f"{business.name} | {business.industry.title()} Services in {location}"
             )
-        
-        if 'meta_keywords' not in content['seo']:
-            content['seo']['meta_keywords'] = requirements.seo_focus_keywords or []
+        seo.setdefault('meta_keywords', requirements.seo_focus_keywords or [])
         
         # Set defaults for CTAs
-        if not content['call_to_actions']:
-            content['call_to_actions'] = [
+        _fill_default(
+            content,
+            'call_to_actions',
+            lambda: [
                 "Get Your Free Quote Today",
                 "Contact Us for Expert Service",
                 "Schedule Your Consultation"
             ]
+        )
         
         # Set defaults for testimonials_section
         if requirements.include_testimonials:
-            if 'title' not in content['testimonials_section']:
-                content['testimonials_section']['title'] = "What Our Customers Say"
-            if 'subtitle' not in content['testimonials_section']:
-                content['testimonials_section']['subtitle'] = (
-                    f"Trusted by customers in {business.city}"
-                )
+            testimonials_section = content['testimonials_section']
+            testimonials_section.setdefault('title', "What Our Customers Say")
+            if 'subtitle' not in testimonials_section:
+                testimonials_section['subtitle'] = f"Trusted by customers in {business.city}"
         
         # Set defaults for contact
-        if 'form_title' not in content['contact']:
-            content['contact']['form_title'] = "Get In Touch"
-        
-        if 'phone_display' not in content['contact']:
-            content['contact']['phone_display'] = business.phone or "N/A"
-        
-        if 'address_display' not in content['contact']:
-            content['contact']['address_display'] = business.address
+        contact = content['contact']
+        contact.setdefault('form_title', "Get In Touch")
+        contact.setdefault('phone_display', business.phone or "N/A")
+        contact.setdefault('address_display', business.address)
         
         # Set defaults for footer
-        if 'copyright_text' not in content['footer']:
-            content['footer']['copyright_text'] = (
-                f"© {current_year} {business.name}. All rights reserved."
+        footer = content['footer']
+        if 'copyright_text' not in footer:
+            footer['copyright_text'] = (
+                f"© {_current_year()} {business.name}. All rights reserved."
             )
         
         # Leave design_theme without color_palette so theme_utils picks one of 5 presets at random
         # (Only ensure the key exists; do not set default palette so each site gets a varied theme.)
         dt = content['design_theme']
-        if not dt.get('font_heading'):
-            dt['font_heading'] = 'Inter'
-        if not dt.get('font_body'):
-            dt['font_body'] = 'Inter'
-        if not dt.get('layout_style'):
-            dt['layout_style'] = 'hero-centered'
-        if not dt.get('theme_name'):
-            dt['theme_name'] = 'Professional'
+        _fill_default(dt, 'font_heading', lambda: 'Inter')
+        _fill_default(dt, 'font_body', lambda: 'Inter')
+        _fill_default(dt, 'layout_style', lambda: 'hero-centered')
+        _fill_default(dt, 'theme_name', lambda: 'Professional')
         
         # Set defaults for image_keywords
         ik = content['image_keywords']
         industry = (business.industry or 'business').replace(' ', ',')
-        if not ik.get('hero'):
-            ik['hero'] = [industry, 'professional', 'quality']
-        if not ik.get('about'):
-            ik['about'] = [industry, 'team', 'local business']
-        if not ik.get('services'):
-            ik['services'] = [industry] * len(content.get('services', []) or [1])
+        _fill_default(ik, 'hero', lambda: [industry, 'professional', 'quality'])
+        _fill_default(ik, 'about', lambda: [industry, 'team', 'local business'])
+        # One keyword per service, in the same order: theme_utils reads them by index.
+        # The design call only sees primary_services, so when the content call invented
+        # its own services the lists can differ; pad with service names or trim.
+        services = content.get('services') or []
+        service_keywords = list(ik.get('services') or [])[:len(services)]
+        for service in services[len(service_keywords):]:
+            name = service.get('name') if isinstance(service, dict) else None
+            service_keywords.append(name or industry)
+        ik['services'] = service_keywords or [industry]
         
         return content
     
@@ -528,7 +892,10 @@ Return your response as a JSON object with the following structure:
             Dictionary with default content.
         """
         business = requirements.business
-        current_year = datetime.now().year
+        current_year = _current_year()
+        location = _format_location(business)
+        industry_title = business.industry.title()
+        industry_kw = business.industry or 'business'
         
         logger.info("Creating default content structure")
         
@@ -552,7 +919,7 @@ Return your response as a JSON object with the following structure:
         else:
             # Default service if none specified
             services.append({
-                'name': f'{business.industry.title()} Services',
+                'name': f'{industry_title} Services',
                 'description': (
                     f"Professional {business.industry} services. "
                     f"We provide quality workmanship and excellent customer service."
@@ -580,18 +947,16 @@ Return your response as a JSON object with the following structure:
         if not seo_keywords and requirements.competitor_analysis:
             seo_keywords = requirements.competitor_analysis.seo_keywords[:10] if requirements.competitor_analysis.seo_keywords else []
         
-        location = f"{business.city}, {business.state or ''}".strip()
-        
         return {
             'business_info': {
                 'name': business.name,
                 'description': (
                     f"{business.name} is a trusted {business.industry} business "
-                    f"serving {business.city}, {business.state or ''} and surrounding areas. "
+                    f"serving {location} and surrounding areas. "
                     f"With a commitment to quality and customer satisfaction, we provide "
                     f"professional services tailored to meet your needs."
                 ),
-                'tagline': f"Quality {business.industry.title()} Services in {location}"
+                'tagline': f"Quality {industry_title} Services in {location}"
             },
             'about_content': {
                 'title': f"About {business.name}",
@@ -609,14 +974,14 @@ Return your response as a JSON object with the following structure:
             'services': services,
             'seo': {
                 'meta_title': (
-                    f"{business.name} | {business.industry.title()} Services in {location}"
+                    f"{business.name} | {industry_title} Services in {location}"
                 ),
                 'meta_description': (
                     f"Professional {business.industry} services in {location}. "
                     f"Contact {business.name} for quality service and customer satisfaction."
                 ),
                 'meta_keywords': seo_keywords,
-                'og_title': f"{business.name} - {business.industry.title()} Services",
+                'og_title': f"{business.name} - {industry_title} Services",
                 'og_description': (
                     f"Professional {business.industry} services in {location}"
                 )
@@ -657,8 +1022,8 @@ Return your response as a JSON object with the following structure:
                 'layout_style': 'hero-centered',
             },
             'image_keywords': {
-                'hero': [business.industry or 'business', 'professional', 'quality'],
-                'about': [business.industry or 'business', 'team', 'local'],
+                'hero': [industry_kw, 'professional', 'quality'],
+                'about': [industry_kw, 'team', 'local'],
                 'services': [business.industry or 'services'] * max(1, len(services)),
             },
         }
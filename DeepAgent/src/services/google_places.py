@@ -1,11 +1,27 @@
 """Google Places API service for business discovery."""
 
+import heapq
 import logging
 import re
+import sqlite3
+import threading
 import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 import googlemaps
-from googlemaps.exceptions import ApiError, HTTPError, Timeout
+import orjson
+import requests
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.models.business import Business
 from src.utils.config import Config
@@ -23,25 +39,150 @@ GOOGLE_BUSINESS_PROFILE_PATTERNS = [
     r'https?://.*google\.com/business',
 ]
 
+# All profile patterns combined into one case-insensitive regex
+GOOGLE_BUSINESS_PROFILE_RE = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in GOOGLE_BUSINESS_PROFILE_PATTERNS),
+    re.IGNORECASE
+)
+
 
 def _is_google_business_profile_url(url: Optional[str]) -> bool:
     """Return True if url is a Google Business Profile link, not a real business website."""
     if not url or not url.strip():
         return False
-    url_lower = url.lower().strip()
-    return any(re.search(p, url_lower) for p in GOOGLE_BUSINESS_PROFILE_PATTERNS)
+    return bool(GOOGLE_BUSINESS_PROFILE_RE.search(url))
+
+
+# Places API (New) text search endpoint; returns details fields in the search response
+PLACES_V1_SEARCH_TEXT_URL = 'https://places.googleapis.com/v1/places:searchText'
+
+# Places API (New) returns at most 20 places per text search request
+PLACES_V1_MAX_RESULT_COUNT = 20
+
+# Places API (New) price level enum -> legacy 0-4 price level
+PLACES_V1_PRICE_LEVELS = {
+    'PRICE_LEVEL_FREE': 0,
+    'PRICE_LEVEL_INEXPENSIVE': 1,
+    'PRICE_LEVEL_MODERATE': 2,
+    'PRICE_LEVEL_EXPENSIVE': 3,
+    'PRICE_LEVEL_VERY_EXPENSIVE': 4,
+}
+
+
+def _is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if error is a Places API rate limit (HTTP 429) error."""
+    return isinstance(error, ApiError) and getattr(error, 'status', None) == 429
+
+
+class PlaceDetailsCache:
+    """
+    Persistent SQLite cache of Place Details results keyed by place_id and requested fields.
+    
+    Place details change rarely, so repeated searches over the same area can
+    skip the Details API call (and its quota) for places seen recently.
+    Entries fetched with a different field list (e.g. before Atmosphere
+    fields were enabled) are never served.
+    Safe to use from the concurrent details fetches in search_businesses.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: float, fields: List[str]):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path to the SQLite database file.
+            ttl_seconds: How long a cached entry stays valid.
+            fields: Place Details fields requested for the cached responses.
+            
+        Raises:
+            OSError: If the cache directory cannot be created.
+            sqlite3.Error: If the database cannot be opened or initialized.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.fields_key = ','.join(sorted(fields))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS place_details_by_fields ("
+                    "place_id TEXT NOT NULL, fields TEXT NOT NULL, data TEXT NOT NULL, "
+                    "fetched_at REAL NOT NULL, PRIMARY KEY (place_id, fields))"
+                )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def get(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return cached details for a place, or None if missing or expired.
+        
+        Args:
+            place_id: Google Places place ID.
+            
+        Returns:
+            Cached place details dictionary, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, fetched_at FROM place_details_by_fields "
+                "WHERE place_id = ? AND fields = ?",
+                (place_id, self.fields_key)
+            ).fetchone()
+        
+        if not row or time.time() - row[1] >= self.ttl_seconds:
+            return None
+        return orjson.loads(row[0])
+    
+    def set(self, place_id: str, details: Dict[str, Any]) -> None:
+        """
+        Store details for a place.
+        
+        Args:
+            place_id: Google Places place ID.
+            details: Place details dictionary to cache.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO place_details_by_fields "
+                "(place_id, fields, data, fetched_at) VALUES (?, ?, ?, ?)",
+                (place_id, self.fields_key, orjson.dumps(details).decode(), time.time())
+            )
 
 
 class GooglePlacesService:
     """Service for searching businesses using Google Places API."""
     
     # Generic types to filter out from place types
-    GENERIC_TYPES = {
+    GENERIC_TYPES = frozenset({
         'establishment',
         'point_of_interest',
         'premise',
         'subpremise'
-    }
+    })
+    
+    # Place Details fields by billing tier. Basic Data fields (name, address,
+    # geometry, types, business status) already come back from text search.
+    CONTACT_FIELDS = [
+        'international_phone_number',
+        'formatted_phone_number',
+        'website'
+    ]
+    ATMOSPHERE_FIELDS = [
+        'rating',
+        'reviews',
+        'price_level'
+    ]
+    
+    # Maximum Place Details requests in flight at once
+    # (the googlemaps client also enforces its own queries-per-second limit)
+    DETAILS_MAX_WORKERS = 5
     
     def __init__(self, config: Config):
         """
@@ -59,8 +200,36 @@ class GooglePlacesService:
         self.config = config
         self.client = googlemaps.Client(key=config.google_places_api_key)
         self.max_results = config.google_places_max_results
+        self.use_v1_search = config.google_places_use_v1_search
+        
+        # Fields requested from Place Details (Atmosphere data is optional)
+        self.details_fields = list(self.CONTACT_FIELDS)
+        if config.place_details_include_atmosphere:
+            self.details_fields += self.ATMOSPHERE_FIELDS
+        
+        # Optional persistent cache for Place Details responses (off unless a path is set)
+        self.details_cache = None
+        if config.place_details_cache_path:
+            try:
+                self.details_cache = PlaceDetailsCache(
+                    config.place_details_cache_path,
+                    ttl_seconds=config.place_details_cache_ttl_days * 86400,
+                    fields=self.details_fields
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Place details cache unavailable at {config.place_details_cache_path}, "
+                    f"continuing without it: {str(e)}"
+                )
+        
         logger.info(f"GooglePlacesService initialized with max_results={self.max_results}")
     
+    def close(self) -> None:
+        """Close the Place Details cache, if one is open."""
+        if self.details_cache:
+            self.details_cache.close()
+            self.details_cache = None
+    
     def search_businesses(
         self,
         industry: str,
@@ -90,8 +259,11 @@ class GooglePlacesService:
         businesses = []
         
         try:
-            # Perform text search
-            places_result = self.client.places(query=query)
+            # Perform text search (Places API (New) returns details in the same call)
+            if self.use_v1_search:
+                places_result = self._search_text_v1(query)
+            else:
+                places_result = self.client.places(query=query)
             
             if not places_result or 'results' not in places_result:
                 logger.warning(f"No results found for query: {query}")
@@ -100,34 +272,33 @@ class GooglePlacesService:
             places = places_result.get('results', [])
             logger.info(f"Found {len(places)} places from text search")
             
+            # Drop repeated place_ids so each place costs one Place Details call
+            seen_place_ids = set()
+            unique_places = []
+            for place in places:
+                place_id = place.get('place_id')
+                if place_id:
+                    if place_id in seen_place_ids:
+                        continue
+                    seen_place_ids.add(place_id)
+                unique_places.append(place)
+            places = unique_places
+            
             # Limit results to max_results
             places = places[:self.max_results]
+            if not places:
+                return businesses
             
-            # Process each place
-            for idx, place in enumerate(places):
-                try:
-                    business = self._extract_business_from_place(
-                        place=place,
-                        industry=industry,
-                        city=city,
-                        state=state
-                    )
-                    
-                    if business:
-                        businesses.append(business)
-                        logger.debug(f"Extracted business: {business.name}")
-                    
-                    # Rate limiting: add delay between Place Details API calls
-                    if idx < len(places) - 1:  # Don't delay after last item
-                        time.sleep(0.15)  # 150ms delay between calls
-                        
-                except Exception as e:
-                    logger.error(
-                        f"Error processing place {place.get('place_id', 'unknown')}: {str(e)}",
-                        exc_info=True
-                    )
-                    # Continue with next place instead of failing completely
-                    continue
+            # Fetch Place Details for all places concurrently (bounded), keeping search order.
+            # Each worker extracts its business as soon as its own details arrive, so
+            # extraction already overlaps with the other in-flight requests.
+            max_workers = min(self.DETAILS_MAX_WORKERS, len(places))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda place: self._process_place(place, industry, city, state),
+                    places
+                )
+                businesses = [business for business in results if business]
             
             logger.info(f"Successfully extracted {len(businesses)} businesses")
             return businesses
@@ -145,6 +316,179 @@ class GooglePlacesService:
             logger.error(f"Unexpected error during business search: {str(e)}", exc_info=True)
             raise
     
+    def _search_text_v1(self, query: str) -> Dict[str, Any]:
+        """
+        Run a Places API (New) text search with a field mask covering every details field.
+        
+        Results are converted to the legacy place format with all requested details
+        fields present, so no separate Place Details call is made for them.
+        
+        Args:
+            query: Text search query.
+            
+        Returns:
+            Dictionary with a 'results' list of places in legacy format.
+            
+        Raises:
+            ApiError: If the API returns an error response.
+            HTTPError: If the API returns a non-200 status without an error body.
+            TransportError: If the request fails or the response is not valid JSON.
+            Timeout: If the request times out.
+        """
+        field_mask = [
+            'places.id',
+            'places.displayName',
+            'places.formattedAddress',
+            'places.location',
+            'places.types',
+            'places.businessStatus',
+            'places.internationalPhoneNumber',
+            'places.nationalPhoneNumber',
+            'places.websiteUri',
+        ]
+        if self.config.place_details_include_atmosphere:
+            field_mask += ['places.rating', 'places.reviews', 'places.priceLevel']
+        
+        try:
+            response = requests.post(
+                PLACES_V1_SEARCH_TEXT_URL,
+                headers={
+                    'X-Goog-Api-Key': self.config.google_places_api_key,
+                    'X-Goog-FieldMask': ','.join(field_mask),
+                },
+                json={
+                    'textQuery': query,
+                    'maxResultCount': min(self.max_results, PLACES_V1_MAX_RESULT_COUNT),
+                },
+                timeout=10
+            )
+        except requests.exceptions.Timeout:
+            raise Timeout()
+        except requests.exceptions.RequestException as e:
+            raise TransportError(e)
+        
+        if response.status_code != 200:
+            # Error bodies are JSON from the API but HTML from proxies and load balancers
+            try:
+                error = orjson.loads(response.content).get('error')
+            except (orjson.JSONDecodeError, AttributeError):
+                error = None
+            if not isinstance(error, dict):
+                raise HTTPError(response.status_code)
+            raise ApiError(error.get('status', response.status_code), error.get('message'))
+        
+        try:
+            data = orjson.loads(response.content) if response.content else {}
+        except orjson.JSONDecodeError as e:
+            raise TransportError(e)
+        
+        places = [self._convert_v1_place(place) for place in data.get('places', [])]
+        return {'results': places}
+    
+    def _convert_v1_place(self, place: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Places API (New) place to the legacy place format.
+        
+        Args:
+            place: Place from a Places API (New) response.
+            
+        Returns:
+            Place dictionary with legacy field names.
+        """
+        location = place.get('location', {})
+        converted = {
+            'place_id': place.get('id'),
+            'name': place.get('displayName', {}).get('text'),
+            'formatted_address': place.get('formattedAddress', ''),
+            'geometry': {
+                'location': {
+                    'lat': location.get('latitude'),
+                    'lng': location.get('longitude')
+                }
+            },
+            'types': place.get('types', []),
+            'business_status': place.get('businessStatus'),
+            'international_phone_number': place.get('internationalPhoneNumber'),
+            'formatted_phone_number': place.get('nationalPhoneNumber'),
+            'website': place.get('websiteUri'),
+        }
+        
+        if self.config.place_details_include_atmosphere:
+            converted['rating'] = place.get('rating')
+            converted['price_level'] = PLACES_V1_PRICE_LEVELS.get(place.get('priceLevel'))
+            converted['reviews'] = [
+                {
+                    'author_name': review.get('authorAttribution', {}).get('displayName'),
+                    'rating': review.get('rating'),
+                    'text': review.get('text', {}).get('text', ''),
+                    'time': self._v1_timestamp(review.get('publishTime')),
+                }
+                for review in place.get('reviews', [])
+            ]
+        
+        return converted
+    
+    @staticmethod
+    def _v1_timestamp(value: Optional[str]) -> int:
+        """
+        Convert a Places API (New) RFC 3339 timestamp to Unix seconds.
+        
+        Args:
+            value: Timestamp string (e.g. "2024-01-15T10:30:00.123456Z").
+            
+        Returns:
+            Unix timestamp in seconds, or 0 if missing or unparseable.
+        """
+        if not value:
+            return 0
+        try:
+            # Trim fractional seconds beyond microseconds; fromisoformat needs an offset, not Z
+            date_part, _, fraction = value.rstrip('Z').partition('.')
+            iso = date_part + (f".{fraction[:6]}" if fraction else '') + '+00:00'
+            return int(datetime.fromisoformat(iso).timestamp())
+        except ValueError:
+            return 0
+    
+    def _process_place(
+        self,
+        place: Dict[str, Any],
+        industry: str,
+        city: str,
+        state: str
+    ) -> Optional[Business]:
+        """
+        Extract a business from a place, logging instead of raising on failure.
+        
+        Args:
+            place: Place data from Google Places text search.
+            industry: Industry keyword from search.
+            city: City name from search.
+            state: State abbreviation from search.
+            
+        Returns:
+            Business object, or None if the place could not be processed.
+        """
+        try:
+            business = self._extract_business_from_place(
+                place=place,
+                industry=industry,
+                city=city,
+                state=state
+            )
+            
+            if business:
+                logger.debug(f"Extracted business: {business.name}")
+            
+            return business
+            
+        except Exception as e:
+            logger.error(
+                f"Error processing place {place.get('place_id', 'unknown')}: {str(e)}",
+                exc_info=True
+            )
+            # Continue with other places instead of failing completely
+            return None
+    
     def _extract_business_from_place(
         self,
         place: Dict[str, Any],
@@ -169,11 +513,15 @@ class GooglePlacesService:
             logger.warning("Place missing place_id, skipping")
             return None
         
-        # Get place details for additional information
-        place_details = self._get_place_details(place_id)
+        # Get place details for additional information, unless text search
+        # already returned every field we would request
+        if all(field in place for field in self.details_fields):
+            place_details = None
+        else:
+            place_details = self._get_place_details(place_id)
         
-        # Merge place data with details (details take precedence)
-        merged_place = {**place, **place_details} if place_details else place
+        # Layer details over place data without copying (details take precedence)
+        merged_place = ChainMap(place_details, place) if place_details else place
         
         try:
             # Extract basic information
@@ -229,23 +577,15 @@ class GooglePlacesService:
                 except (ValueError, TypeError):
                     price_level = None
             
-            # Extract and filter types
+            # Extract and filter types (Places API types are already lower-case)
             types = merged_place.get('types', [])
-            filtered_types = [
-                t for t in types
-                if t.lower() not in self.GENERIC_TYPES
-            ]
+            filtered_types = [t for t in types if t not in self.GENERIC_TYPES]
             
             # Extract reviews (up to 5 most recent)
             reviews = merged_place.get('reviews', [])
             if reviews:
-                # Sort by time (most recent first) and limit to 5
-                sorted_reviews = sorted(
-                    reviews,
-                    key=lambda r: r.get('time', 0),
-                    reverse=True
-                )[:5]
-                reviews = sorted_reviews
+                # Pick the 5 most recent without sorting the full list
+                reviews = heapq.nlargest(5, reviews, key=lambda r: r.get('time', 0))
             else:
                 reviews = []
             
@@ -280,7 +620,7 @@ class GooglePlacesService:
     
     def _get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get detailed information for a place using Place Details API.
+        Get detailed information for a place, using the details cache when enabled.
         
         Args:
             place_id: Google Places place ID.
@@ -288,26 +628,37 @@ class GooglePlacesService:
         Returns:
             Place details dictionary, or None if request fails.
         """
-        # Request only the fields we need
-        fields = [
-            'name',
-            'formatted_address',
-            'international_phone_number',
-            'formatted_phone_number',
-            'website',
-            'rating',
-            'reviews',
-            'geometry',
-            'business_status',
-            'price_level',
-            'types'
-        ]
+        if self.details_cache:
+            try:
+                cached = self.details_cache.get(place_id)
+                if cached is not None:
+                    logger.debug(f"Using cached place details for {place_id}")
+                    return cached
+            except sqlite3.Error as e:
+                logger.warning(f"Place details cache read failed for {place_id}: {str(e)}")
+        
+        details = self._fetch_place_details(place_id)
         
+        if details is not None and self.details_cache:
+            try:
+                self.details_cache.set(place_id, details)
+            except sqlite3.Error as e:
+                logger.warning(f"Place details cache write failed for {place_id}: {str(e)}")
+        
+        return details
+    
+    def _fetch_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch place details from the Place Details API.
+        
+        Args:
+            place_id: Google Places place ID.
+            
+        Returns:
+            Place details dictionary, or None if request fails.
+        """
         try:
-            result = self.client.place(
-                place_id=place_id,
-                fields=fields
-            )
+            result = self._request_place_details(place_id)
             
             if result and 'result' in result:
                 return result['result']
@@ -315,22 +666,7 @@ class GooglePlacesService:
             return None
             
         except ApiError as e:
-            # Handle rate limiting with exponential backoff
-            if hasattr(e, 'status') and e.status == 429:
-                logger.warning(f"Rate limit hit for place {place_id}, retrying with backoff")
-                time.sleep(1.0)  # Wait 1 second
-                try:
-                    result = self.client.place(
-                        place_id=place_id,
-                        fields=fields
-                    )
-                    if result and 'result' in result:
-                        return result['result']
-                except Exception as retry_error:
-                    logger.error(
-                        f"Retry failed for place {place_id}: {str(retry_error)}"
-                    )
-            
+            # Non-rate-limit API errors, or rate limiting that outlasted the retries
             logger.warning(
                 f"Failed to get place details for {place_id}: {str(e)}"
             )
@@ -348,3 +684,29 @@ class GooglePlacesService:
                 exc_info=True
             )
             return None
+    
+    @retry(
+        retry=retry_if_exception(_is_rate_limit_error),
+        wait=wait_exponential_jitter(multiplier=0.5, max=10),
+        stop=stop_after_attempt(4),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    def _request_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Call the Place Details API, retrying rate limit errors with jittered backoff.
+        
+        Jitter spreads out retries from the concurrent details workers so they
+        do not all hit the API again at the same moment.
+        
+        Args:
+            place_id: Google Places place ID.
+            
+        Returns:
+            Raw Place Details API response.
+        """
+        # Request only the fields we need
+        return self.client.place(
+            place_id=place_id,
+            fields=self.details_fields
+        )
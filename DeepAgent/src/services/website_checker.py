@@ -2,9 +2,11 @@
 
 import logging
 import re
-from typing import Optional
-from urllib.parse import urlparse
-import requests
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from requests.utils import get_environ_proxies
 from requests.exceptions import (
     RequestException,
     Timeout,
@@ -15,10 +17,50 @@ from requests.exceptions import (
 
 from src.models.business import Business
 from src.utils.config import Config
+from src.utils.http import create_session, ensure_scheme, parse_url
 
 
 logger = logging.getLogger(__name__)
 
+# How long a host's DNS resolvability is remembered (seconds)
+DNS_CACHE_TTL = 300
+
+# host -> (resolves, checked_at); shared by all checker instances
+_dns_cache: Dict[str, Tuple[bool, float]] = {}
+_dns_cache_lock = threading.Lock()
+
+
+def _host_resolves(host: str) -> bool:
+    """
+    Return False only if DNS says the host name does not exist, caching the answer briefly.
+    
+    Lets checks for dead domains fail fast (and only once per TTL) instead of
+    going through the HTTP client's connection attempts and retries. Any other
+    lookup failure (e.g. a temporary EAI_AGAIN) is not cached and counts as
+    resolving, so the HTTP request decides.
+    """
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(host)
+    if cached and now - cached[1] < DNS_CACHE_TTL:
+        return cached[0]
+    
+    try:
+        socket.getaddrinfo(host, None)
+        resolves = True
+    except socket.gaierror as e:
+        if e.errno != socket.EAI_NONAME:
+            logger.debug(f"DNS lookup for {host} failed ({e}); leaving it to the HTTP request")
+            return True
+        resolves = False
+    except UnicodeError:
+        # Host names that cannot be IDNA-encoded never resolve
+        resolves = False
+    
+    with _dns_cache_lock:
+        _dns_cache[host] = (resolves, now)
+    return resolves
+
 
 class WebsiteCheckerService:
     """Service for checking if a business has a valid, accessible website."""
@@ -32,6 +74,38 @@ class WebsiteCheckerService:
         r'https?://.*google\.com/business',
     ]
     
+    # All patterns combined into one case-insensitive regex so each check is a single scan
+    GOOGLE_BUSINESS_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in GOOGLE_BUSINESS_PATTERNS),
+        re.IGNORECASE
+    )
+    
+    # Social, directory and listing sites: a business page there is not its own website
+    NON_WEBSITE_HOSTS = frozenset({
+        'facebook.com',
+        'instagram.com',
+        'twitter.com',
+        'x.com',
+        'linkedin.com',
+        'tiktok.com',
+        'youtube.com',
+        'pinterest.com',
+        'yelp.com',
+        'nextdoor.com',
+        'bbb.org',
+        'angi.com',
+        'angieslist.com',
+        'homeadvisor.com',
+        'thumbtack.com',
+        'houzz.com',
+        'yellowpages.com',
+        'mapquest.com',
+        'foursquare.com',
+        'tripadvisor.com',
+        'bing.com',
+        'linktr.ee',
+    })
+    
     def __init__(self, config: Config):
         """
         Initialize website checker service.
@@ -47,8 +121,17 @@ class WebsiteCheckerService:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36"
         )
+        # One pooled session so repeated checks reuse keep-alive connections
+        self.session = create_session(
+            self.user_agent,
+            {'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'}
+        )
         logger.info("WebsiteCheckerService initialized")
     
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
     def is_google_business_profile(self, url: str) -> bool:
         """
         Detect if URL is a Google Business Profile link.
@@ -62,12 +145,34 @@ class WebsiteCheckerService:
         if not url:
             return False
         
-        url_lower = url.lower().strip()
-        
         # Check against known Google Business Profile patterns
-        for pattern in self.GOOGLE_BUSINESS_PATTERNS:
-            if re.search(pattern, url_lower):
-                logger.debug(f"Detected Google Business Profile link: {url}")
+        if self.GOOGLE_BUSINESS_RE.search(url):
+            logger.debug(f"Detected Google Business Profile link: {url}")
+            return True
+        
+        return False
+    
+    def is_non_website_host(self, url: str) -> bool:
+        """
+        Detect if URL points to a social, directory or listing site.
+        
+        Args:
+            url: URL string to check.
+            
+        Returns:
+            True if the URL's host (or a parent domain) is in NON_WEBSITE_HOSTS.
+        """
+        if not url:
+            return False
+        
+        url = ensure_scheme(url)
+        host = (parse_url(url).hostname or '').removeprefix('www.')
+        
+        # Check the host and each parent domain (m.facebook.com -> facebook.com)
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            if '.'.join(labels[i:]) in self.NON_WEBSITE_HOSTS:
+                logger.debug(f"Detected social/directory link: {url}")
                 return True
         
         return False
@@ -85,27 +190,30 @@ class WebsiteCheckerService:
         if not url:
             return False
         
+        # Normalize once at entry so scheme-less URLs (example.com) are accepted
+        url = ensure_scheme(url)
+        
         try:
             # Validate URL format
-            parsed = urlparse(url)
+            parsed = parse_url(url)
             if not parsed.scheme or not parsed.netloc:
                 logger.warning(f"Invalid URL format: {url}")
                 return False
             
-            # Ensure URL has a scheme
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
+            # Skip the HTTP request entirely for hosts that do not resolve
+            # (unless a proxy is configured: then only the proxy resolves names)
+            if (
+                parsed.hostname
+                and not get_environ_proxies(url)
+                and not _host_resolves(parsed.hostname)
+            ):
+                logger.warning(f"Host does not resolve for URL: {url}")
+                return False
             
             # Make HEAD request first (lighter, faster)
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
             try:
-                response = requests.head(
+                response = self.session.head(
                     url,
-                    headers=headers,
                     timeout=self.timeout,
                     allow_redirects=True
                 )
@@ -120,9 +228,8 @@ class WebsiteCheckerService:
                 # If HEAD is not allowed, try GET
                 if response.status_code == 405:  # Method Not Allowed
                     logger.debug(f"HEAD not allowed for {url}, trying GET")
-                    response = requests.get(
+                    response = self.session.get(
                         url,
-                        headers=headers,
                         timeout=self.timeout,
                         allow_redirects=True,
                         stream=True  # Don't download full content
@@ -191,6 +298,11 @@ class WebsiteCheckerService:
             logger.debug(f"URL is Google Business Profile, not a real website: {website_url}")
             return False
         
+        # Social and directory pages are not a real website either; skip the HTTP check
+        if self.is_non_website_host(website_url):
+            logger.debug(f"URL is a social/directory page, not a real website: {website_url}")
+            return False
+        
         # Verify URL accessibility
         is_accessible = self.verify_url_accessibility(website_url)
         
@@ -1,10 +1,13 @@
 """Website scraper service for extracting content from competitor websites."""
 
+import atexit
 import logging
+import multiprocessing
+import threading
 import time
+from email.message import Message
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse
-import requests
 from requests.exceptions import (
     RequestException,
     Timeout,
@@ -12,13 +15,98 @@ from requests.exceptions import (
     SSLError,
     TooManyRedirects
 )
-from bs4 import BeautifulSoup
+from bs4 import UnicodeDammit
+from lxml import etree, html
+from lxml.html import soupparser
 
 from src.utils.config import Config
+from src.utils.http import create_session, ensure_scheme, parse_url
 
 
 logger = logging.getLogger(__name__)
 
+# Boilerplate sections whose paragraphs, links and images are not page content
+SKIPPED_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header', 'aside'})
+
+# Layout sections reported in the page structure summary
+STRUCTURE_TAGS = frozenset({'nav', 'footer', 'header'})
+
+# Text nodes under an element, leaving out those inside SKIPPED_TAGS (e.g. inline scripts)
+_VISIBLE_TEXT = etree.XPath(
+    './/text()[not(' + ' or '.join(f'ancestor::{tag}' for tag in sorted(SKIPPED_TAGS)) + ')]'
+)
+
+# Shared process pools for HTML parsing, one per worker count (created on first use)
+_parse_pools: Dict[int, ProcessPoolExecutor] = {}
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared parsing process pool for max_workers, creating it on first use.
+    
+    Pools are created from scraping threads, so workers are started with
+    "spawn": forking a process while other threads hold locks can deadlock
+    the child.
+    """
+    with _parse_pool_lock:
+        pool = _parse_pools.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            _parse_pools[max_workers] = pool
+        return pool
+
+
+def shutdown_parse_pools() -> None:
+    """Shut down the shared parsing process pools (also run at interpreter exit)."""
+    with _parse_pool_lock:
+        pools = list(_parse_pools.values())
+        _parse_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_parse_pools)
+
+
+def _charset_from_content_type(content_type: str) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, if any."""
+    if not content_type:
+        return None
+    message = Message()
+    message['Content-Type'] = content_type
+    return message.get_content_charset()
+
+
+def _visible_text(el: html.HtmlElement) -> str:
+    """Return an element's stripped text, without text from SKIPPED_TAGS descendants."""
+    return ''.join(_VISIBLE_TEXT(el)).strip()
+
+
+def _parse_and_extract(
+    content: bytes,
+    url: str,
+    max_content_length: int,
+    encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Parse a page and extract its content (module-level so it can run in a worker process).
+    
+    Args:
+        content: Raw response body.
+        url: Original URL of the page.
+        max_content_length: Maximum characters of paragraph text to keep.
+        encoding: Charset from the Content-Type header, if any.
+        
+    Returns:
+        Dictionary with structured content.
+    """
+    root = WebsiteScraperService._parse_html(content, encoding)
+    return WebsiteScraperService._extract_content(root, url, max_content_length)
+
 
 class WebsiteScraperService:
     """Service for scraping and extracting content from websites."""
@@ -33,14 +121,30 @@ class WebsiteScraperService:
         self.config = config
         self.timeout = 10  # seconds
         self.max_content_length = 5000  # characters to limit content size
+        self.max_download_bytes = 512 * 1024  # only the start of large pages is parsed
         self.user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36"
         )
-        self.request_delay = 0.5  # seconds between requests
+        self.request_delay = 0.5  # seconds between requests to the same host
+        self.max_workers = config.website_scraper_max_workers
+        # Worker processes for HTML parsing; 0 parses in the scraping thread
+        self.parse_processes = config.website_scraper_parse_processes
+        # One pooled session so repeated scrapes reuse keep-alive connections
+        self.session = create_session(
+            self.user_agent,
+            {
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+            }
+        )
         logger.info("WebsiteScraperService initialized")
     
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
     def scrape_website_content(self, website_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape content from a website URL.
@@ -58,46 +162,55 @@ class WebsiteScraperService:
         website_url = website_url.strip()
         
         # Ensure URL has a scheme
-        if not website_url.startswith(('http://', 'https://')):
-            website_url = 'https://' + website_url
+        website_url = ensure_scheme(website_url)
         
         logger.info(f"Scraping website: {website_url}")
         
         try:
             # Validate URL format
-            parsed = urlparse(website_url)
+            parsed = parse_url(website_url)
             if not parsed.scheme or not parsed.netloc:
                 logger.warning(f"Invalid URL format: {website_url}")
                 return None
             
-            # Make HTTP GET request
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-            }
-            
+            # Make HTTP GET request (streamed so large pages are not fully downloaded)
             try:
-                response = requests.get(
+                with self.session.get(
                     website_url,
-                    headers=headers,
                     timeout=self.timeout,
-                    allow_redirects=True
-                )
+                    allow_redirects=True,
+                    stream=True
+                ) as response:
+                    # Check if request was successful
+                    if response.status_code != 200:
+                        logger.warning(
+                            f"Website returned non-200 status code: {website_url} "
+                            f"(status: {response.status_code})"
+                        )
+                        return None
+                    
+                    # Skip non-HTML responses (PDFs, images, etc.) without downloading them
+                    content_type = response.headers.get('Content-Type', '')
+                    if content_type and 'html' not in content_type.lower():
+                        logger.warning(
+                            f"Website returned non-HTML content: {website_url} "
+                            f"(Content-Type: {content_type})"
+                        )
+                        return None
+                    
+                    encoding = _charset_from_content_type(content_type)
+                    body = self._read_capped(response)
                 
-                # Check if request was successful
-                if response.status_code != 200:
-                    logger.warning(
-                        f"Website returned non-200 status code: {website_url} "
-                        f"(status: {response.status_code})"
+                # Parse HTML and extract content, in a worker process when enabled so
+                # CPU-bound parsing does not hold the GIL against other scrapes
+                if self.parse_processes > 0:
+                    content_data = _get_parse_pool(self.parse_processes).submit(
+                        _parse_and_extract, body, website_url, self.max_content_length, encoding
+                    ).result()
+                else:
+                    content_data = _parse_and_extract(
+                        body, website_url, self.max_content_length, encoding
                     )
-                    return None
-                
-                # Parse HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract content
-                content_data = self._extract_content(soup, website_url)
                 
                 logger.info(
                     f"Successfully scraped website: {website_url} "
@@ -129,94 +242,181 @@ class WebsiteScraperService:
             )
             return None
     
-    def _extract_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _read_capped(self, response) -> bytes:
+        """
+        Read a streamed response body, stopping after max_download_bytes.
+        
+        Args:
+            response: Streamed requests.Response.
+            
+        Returns:
+            Response body, truncated to max_download_bytes.
+        """
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body.extend(chunk)
+            if len(body) >= self.max_download_bytes:
+                logger.debug(
+                    f"Truncated download of {response.url} at {self.max_download_bytes} bytes"
+                )
+                break
+        return bytes(body[:self.max_download_bytes])
+    
+    @staticmethod
+    def _parse_html(content: bytes, encoding: Optional[str] = None) -> html.HtmlElement:
+        """
+        Decode HTML and parse it with lxml's C parser, falling back to BeautifulSoup.
+        
+        The body is decoded the way BeautifulSoup does it: the header charset
+        first, then <meta charset>, then detection. Handing lxml raw bytes
+        would make it assume Latin-1 for pages that declare no charset.
+        
+        lxml rejects some inputs outright (e.g. empty or comment-only
+        documents); BeautifulSoup's lenient parser still produces a tree for
+        those, so the page yields empty content instead of failing.
+        
+        Args:
+            content: Raw response body.
+            encoding: Charset from the Content-Type header, if any.
+            
+        Returns:
+            Root element of the parsed document.
+        """
+        markup = ''
+        if content:
+            markup = UnicodeDammit(
+                content,
+                [encoding] if encoding else [],
+                is_html=True
+            ).unicode_markup or ''
+        # Re-encode as UTF-8 bytes: lxml refuses str input that carries an XML
+        # encoding declaration, and the explicit parser encoding overrides it
+        utf8_markup = markup.encode('utf-8')
+        try:
+            return html.document_fromstring(
+                utf8_markup,
+                parser=html.HTMLParser(encoding='utf-8')
+            )
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"lxml could not parse page ({str(e)}), falling back to BeautifulSoup")
+            return soupparser.fromstring(markup)
+    
+    @staticmethod
+    def _extract_content(
+        root: html.HtmlElement,
+        url: str,
+        max_content_length: int
+    ) -> Dict[str, Any]:
         """
-        Extract structured content from parsed HTML.
+        Extract structured content from parsed HTML in a single tree walk.
         
         Args:
-            soup: BeautifulSoup parsed HTML object.
+            root: Root element of the parsed HTML document.
             url: Original URL of the page.
+            max_content_length: Maximum characters of paragraph text to keep.
             
         Returns:
             Dictionary with extracted content.
         """
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.get_text(strip=True) if title_tag else ""
+        parsed_url = parse_url(url)
+        base_domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        
+        title = ""
+        meta_description = ""
+        meta_keywords_str = ""
+        headings_by_tag: Dict[str, List[str]] = {'h1': [], 'h2': [], 'h3': []}
+        paragraph_texts = []
+        paragraph_count = 0
+        # Insertion-ordered set of internal links (first-seen first), capped at 20
+        links: Dict[str, None] = {}
+        images = []
+        structure_tags = set()
+        
+        # Depth inside script/style/nav/footer/header/aside: paragraphs, links and
+        # images there are boilerplate and skipped (headings are still collected)
+        skip_depth = 0
         
-        # Extract meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_description = meta_desc.get('content', '') if meta_desc else ""
+        for event, el in etree.iterwalk(root, events=('start', 'end')):
+            tag = el.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                continue
+            
+            if event == 'end':
+                if tag in SKIPPED_TAGS:
+                    skip_depth -= 1
+                continue
+            
+            if tag in SKIPPED_TAGS:
+                skip_depth += 1
+                if tag in STRUCTURE_TAGS:
+                    structure_tags.add(tag)
+                continue
+            
+            if tag in headings_by_tag:
+                heading_text = el.text_content().strip()
+                if heading_text:
+                    headings_by_tag[tag].append(heading_text)
+            elif tag == 'title':
+                if not title:
+                    title = el.text_content().strip()
+            elif tag == 'meta':
+                name = el.get('name')
+                if name == 'description' and not meta_description:
+                    meta_description = el.get('content', '')
+                elif name == 'keywords' and not meta_keywords_str:
+                    meta_keywords_str = el.get('content', '')
+            elif skip_depth:
+                continue
+            elif tag == 'p':
+                paragraph_count += 1
+                paragraph_text = _visible_text(el)
+                if paragraph_text:
+                    paragraph_texts.append(paragraph_text)
+            elif tag == 'a':
+                href = el.get('href')
+                if href and len(links) < 20:
+                    # Convert relative URLs to absolute
+                    if href.startswith('/'):
+                        href = base_domain + href
+                    elif not href.startswith(('http://', 'https://')):
+                        continue
+                    
+                    # Only include internal links
+                    if href.startswith(base_domain) and _visible_text(el):
+                        links[href] = None
+            elif tag == 'img':
+                # Alt text for context
+                alt_text = el.get('alt')
+                if alt_text:
+                    images.append(alt_text)
         
-        # Extract meta keywords
-        meta_keywords_tag = soup.find('meta', attrs={'name': 'keywords'})
-        meta_keywords_str = meta_keywords_tag.get('content', '') if meta_keywords_tag else ""
         meta_keywords = [
             kw.strip() 
             for kw in meta_keywords_str.split(',') 
             if kw.strip()
         ] if meta_keywords_str else []
         
-        # Extract headings (h1, h2, h3)
-        headings = []
-        for tag in ['h1', 'h2', 'h3']:
-            for heading in soup.find_all(tag):
-                heading_text = heading.get_text(strip=True)
-                if heading_text:
-                    headings.append(heading_text)
-        
-        # Extract main content (paragraphs)
-        # Remove script, style, nav, footer, header tags
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            tag.decompose()
-        
-        # Get all paragraph text
-        paragraphs = soup.find_all('p')
-        content_text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+        # h1s, then h2s, then h3s
+        headings = headings_by_tag['h1'] + headings_by_tag['h2'] + headings_by_tag['h3']
         
         # Limit content size
-        if len(content_text) > self.max_content_length:
-            content_text = content_text[:self.max_content_length] + "..."
+        content_text = ' '.join(paragraph_texts)
+        if len(content_text) > max_content_length:
+            content_text = content_text[:max_content_length] + "..."
         
-        # Extract links (internal navigation)
-        links = []
-        parsed_url = urlparse(url)
-        base_domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if href:
-                # Convert relative URLs to absolute
-                if href.startswith('/'):
-                    href = base_domain + href
-                elif not href.startswith(('http://', 'https://')):
-                    continue
-                
-                # Only include internal links
-                if href.startswith(base_domain):
-                    link_text = link.get_text(strip=True)
-                    if link_text:
-                        links.append(href)
-        
-        # Remove duplicates from links
-        links = list(set(links))[:20]  # Limit to 20 links
-        
-        # Extract images (alt text for context)
-        images = []
-        for img in soup.find_all('img', alt=True):
-            alt_text = img.get('alt', '')
-            if alt_text:
-                images.append(alt_text)
+        # Already deduplicated and limited to 20 links
+        links = list(links)
         
         images = images[:20]  # Limit to 20 images
         
         # Extract page structure info
         structure = {
-            'has_nav': bool(soup.find('nav')),
-            'has_footer': bool(soup.find('footer')),
-            'has_header': bool(soup.find('header')),
+            'has_nav': 'nav' in structure_tags,
+            'has_footer': 'footer' in structure_tags,
+            'has_header': 'header' in structure_tags,
             'heading_count': len(headings),
-            'paragraph_count': len(paragraphs),
+            'paragraph_count': paragraph_count,
             'link_count': len(links),
             'image_count': len(images),
         }
@@ -245,27 +445,29 @@ class WebsiteScraperService:
         """
         logger.info(f"Scraping {len(websites)} websites")
         
-        scraped_content = []
+        if not websites:
+            return []
         
-        for i, website_url in enumerate(websites):
-            try:
-                # Add delay between requests (except for first request)
-                if i > 0:
+        # Group by host: different hosts are scraped concurrently, while pages on the
+        # same host are fetched one at a time with a polite delay between them
+        indices_by_host: Dict[str, List[int]] = {}
+        for idx, website_url in enumerate(websites):
+            indices_by_host.setdefault(self._host_key(website_url), []).append(idx)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(websites)
+        
+        def scrape_host(indices: List[int]) -> None:
+            for n, idx in enumerate(indices):
+                if n > 0:
                     time.sleep(self.request_delay)
-                
-                content = self.scrape_website_content(website_url)
-                if content:
-                    scraped_content.append(content)
-                else:
-                    logger.warning(f"Failed to scrape website: {website_url}")
-                    
-            except Exception as e:
-                logger.error(
-                    f"Error scraping website {website_url}: {str(e)}",
-                    exc_info=True
-                )
-                # Continue with next website
-                continue
+                results[idx] = self._scrape_safely(websites[idx])
+        
+        max_workers = max(1, min(self.max_workers, len(indices_by_host)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(scrape_host, indices_by_host.values()))
+        
+        # Keep results in input order (failed scrapes are skipped)
+        scraped_content = [content for content in results if content]
         
         logger.info(
             f"Website scraping completed: {len(scraped_content)}/{len(websites)} "
@@ -273,3 +475,40 @@ class WebsiteScraperService:
         )
         
         return scraped_content
+    
+    def _scrape_safely(self, website_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a website, logging instead of raising on failure.
+        
+        Args:
+            website_url: URL of the website to scrape.
+            
+        Returns:
+            Content dictionary, or None if scraping failed.
+        """
+        try:
+            content = self.scrape_website_content(website_url)
+            if not content:
+                logger.warning(f"Failed to scrape website: {website_url}")
+            return content
+            
+        except Exception as e:
+            logger.error(
+                f"Error scraping website {website_url}: {str(e)}",
+                exc_info=True
+            )
+            return None
+    
+    @staticmethod
+    def _host_key(website_url: Optional[str]) -> str:
+        """
+        Return the lowercase host of a URL, used to serialize same-host scrapes.
+        
+        Args:
+            website_url: Website URL (scheme optional).
+            
+        Returns:
+            Host name, or the raw URL when no host can be parsed.
+        """
+        url = ensure_scheme((website_url or '').strip())
+        return parse_url(url).netloc.lower() or (website_url or '')
@@ -1,14 +1,114 @@
 """Configuration management for the application."""
 
 import os
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
 
+# Project root (2 levels up from src/utils)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Default .env location, as a plain string computed once
+_DEFAULT_ENV_PATH = os.path.join(str(_PROJECT_ROOT), ".env")
+
+# .env files already loaded into os.environ. load_dotenv never overrides
+# variables that are already set, so loading the same file again is a no-op.
+_dotenv_loaded: Set[str] = set()
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment value ("1", "true" or "yes" are true)."""
+    return value.lower() in ("1", "true", "yes")
+
+
+def _optional_str(value: str) -> Optional[str]:
+    """Treat an empty environment value as unset."""
+    return value or None
+
+
+def _project_path(value: str) -> Optional[str]:
+    """Resolve a path relative to the project root; empty disables the feature."""
+    return str(_PROJECT_ROOT / value) if value else None
+
+
+# Settings read from the environment: (attribute, env var, cast, default).
+# Defaults are raw strings passed through the cast like environment values.
+_SCHEMA: Tuple[Tuple[str, str, Callable[[str], Any], Optional[str]], ...] = (
+    # Google Places API
+    ("google_places_api_key", "GOOGLE_PLACES_API_KEY", str, None),
+    
+    # LLM Configuration
+    ("openai_api_key", "OPENAI_API_KEY", str, None),
+    ("anthropic_api_key", "ANTHROPIC_API_KEY", str, None),
+    ("llm_provider", "LLM_PROVIDER", str.lower, "openai"),
+    ("llm_model", "LLM_MODEL", str, "gpt-4-turbo-preview"),
+    
+    # Output Configuration
+    ("output_dir", "OUTPUT_DIR", str, "generated_sites"),
+    
+    # Google Places API Settings
+    ("google_places_max_results", "GOOGLE_PLACES_MAX_RESULTS", int, "20"),
+    # Use Places API (New) text search, which returns details in one call
+    # (requires "Places API (New)" to be enabled for the API key)
+    ("google_places_use_v1_search", "GOOGLE_PLACES_USE_V1_SEARCH", _env_bool, "false"),
+    # Place Details cache (SQLite file, relative to project root); opt-in, empty disables it
+    ("place_details_cache_path", "PLACE_DETAILS_CACHE_PATH", _project_path, ""),
+    ("place_details_cache_ttl_days", "PLACE_DETAILS_CACHE_TTL_DAYS", int, "7"),
+    # Request Atmosphere fields (reviews, rating, price level) from Place Details
+    ("place_details_include_atmosphere", "PLACE_DETAILS_INCLUDE_ATMOSPHERE", _env_bool, "true"),
+    
+    # Competitor Analysis Settings
+    ("competitor_analysis_max_competitors", "COMPETITOR_ANALYSIS_MAX_COMPETITORS", int, "5"),
+    
+    # Website Scraper Settings
+    ("website_scraper_timeout", "WEBSITE_SCRAPER_TIMEOUT", int, "10"),
+    ("website_scraper_max_workers", "WEBSITE_SCRAPER_MAX_WORKERS", int, "16"),
+    ("website_scraper_parse_processes", "WEBSITE_SCRAPER_PARSE_PROCESSES", int, "0"),
+    
+    # Content Generation Settings
+    ("content_generation_temperature", "CONTENT_GENERATION_TEMPERATURE", float, "0.7"),
+    ("competitor_analysis_temperature", "COMPETITOR_ANALYSIS_TEMPERATURE", float, "0.3"),
+    ("content_generation_max_competitor_items", "CONTENT_GENERATION_MAX_COMPETITOR_ITEMS", int, "15"),
+    
+    # Logging Settings
+    ("log_level", "LOG_LEVEL", str.upper, "INFO"),
+    
+    # Optional: Unsplash API for relevant stock images in generated sites
+    ("unsplash_access_key", "UNSPLASH_ACCESS_KEY", _optional_str, None),
+)
+
+
+# Configuration checks: (predicate that is True when invalid, error message).
+# Messages are formatted with the config instance as "config".
+_VALIDATION_RULES: Tuple[Tuple[Callable[["Config"], bool], str], ...] = (
+    (
+        lambda c: not c.google_places_api_key,
+        "GOOGLE_PLACES_API_KEY is required",
+    ),
+    (
+        lambda c: c.llm_provider == "openai" and not c.openai_api_key,
+        "OPENAI_API_KEY is required when LLM_PROVIDER=openai",
+    ),
+    (
+        lambda c: c.llm_provider == "anthropic" and not c.anthropic_api_key,
+        "ANTHROPIC_API_KEY is required when LLM_PROVIDER=anthropic",
+    ),
+    (
+        lambda c: c.llm_provider not in ("openai", "anthropic"),
+        "LLM_PROVIDER must be 'openai' or 'anthropic', got: {config.llm_provider}",
+    ),
+)
+
+
 class Config:
     """Application configuration loaded from environment variables."""
     
+    # Fixed attribute set: every schema setting plus the cached repr and output path
+    __slots__ = tuple(attr for attr, _, _, _ in _SCHEMA) + (
+        "_repr", "_output_path_cached", "_frozen"
+    )
+    
     def __init__(self, env_file: Optional[str] = None):
         """
         Initialize configuration.
@@ -16,70 +116,58 @@ class Config:
         Args:
             env_file: Optional path to .env file. If None, looks for .env in project root.
         """
-        # Load environment variables
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            # Try to find .env in project root (2 levels up from src/utils)
-            project_root = Path(__file__).parent.parent.parent
-            env_path = project_root / ".env"
-            load_dotenv(env_path)
-        
-        # Google Places API
-        self.google_places_api_key = os.getenv("GOOGLE_PLACES_API_KEY")
-        
-        # LLM Configuration
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-        self.llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
-        self.llm_model = os.getenv("LLM_MODEL", "gpt-4-turbo-preview")
+        object.__setattr__(self, "_frozen", False)
         
-        # Output Configuration
-        self.output_dir = os.getenv("OUTPUT_DIR", "generated_sites")
-        
-        # Google Places API Settings
-        self.google_places_max_results = int(os.getenv("GOOGLE_PLACES_MAX_RESULTS", "20"))
-        
-        # Competitor Analysis Settings
-        self.competitor_analysis_max_competitors = int(
-            os.getenv("COMPETITOR_ANALYSIS_MAX_COMPETITORS", "5")
-        )
-        
-        # Website Scraper Settings
-        self.website_scraper_timeout = int(os.getenv("WEBSITE_SCRAPER_TIMEOUT", "10"))
-        
-        # Content Generation Settings
-        self.content_generation_temperature = float(
-            os.getenv("CONTENT_GENERATION_TEMPERATURE", "0.7")
-        )
-        self.competitor_analysis_temperature = float(
-            os.getenv("COMPETITOR_ANALYSIS_TEMPERATURE", "0.3")
+        # Load environment variables (each .env file is only read once per process)
+        # (default: .env in project root)
+        env_path = os.path.abspath(env_file) if env_file else _DEFAULT_ENV_PATH
+        if env_path not in _dotenv_loaded:
+            load_dotenv(env_path)
+            _dotenv_loaded.add(env_path)
+        
+        # Read every setting via the typed schema with one bound environment lookup.
+        # Not copied to a dict: copying decodes every variable in the environment,
+        # which costs more than the handful of keys looked up here.
+        env_get = os.environ.get
+        for attr, key, cast, default in _SCHEMA:
+            raw = env_get(key, default)
+            setattr(self, attr, cast(raw) if raw is not None else None)
+        
+        # Settings do not change after loading, so the repr is built once
+        self._repr = (
+            f"Config("
+            f"llm_provider={self.llm_provider}, "
+            f"llm_model={self.llm_model}, "
+            f"output_dir={self.output_dir}, "
+            f"google_places_max_results={self.google_places_max_results}, "
+            f"competitor_analysis_max_competitors={self.competitor_analysis_max_competitors}, "
+            f"website_scraper_timeout={self.website_scraper_timeout}, "
+            f"content_generation_temperature={self.content_generation_temperature}, "
+            f"competitor_analysis_temperature={self.competitor_analysis_temperature}, "
+            f"log_level={self.log_level}"
+            f")"
         )
         
-        # Logging Settings
-        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        
-        # Optional: Unsplash API for relevant stock images in generated sites
-        self.unsplash_access_key = os.getenv("UNSPLASH_ACCESS_KEY") or None
-        
         # Validate required configuration
         self._validate()
+        
+        # Settings are read-only from here on, so cached values (repr, output path,
+        # get_config instances) can never go stale
+        object.__setattr__(self, "_frozen", True)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute writes once the configuration is loaded."""
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Config is frozen; cannot set {name!r}")
+        object.__setattr__(self, name, value)
     
     def _validate(self) -> None:
         """Validate that required configuration is present."""
-        errors = []
-        
-        if not self.google_places_api_key:
-            errors.append("GOOGLE_PLACES_API_KEY is required")
-        
-        if self.llm_provider == "openai" and not self.openai_api_key:
-            errors.append("OPENAI_API_KEY is required when LLM_PROVIDER=openai")
-        
-        if self.llm_provider == "anthropic" and not self.anthropic_api_key:
-            errors.append("ANTHROPIC_API_KEY is required when LLM_PROVIDER=anthropic")
-        
-        if self.llm_provider not in ["openai", "anthropic"]:
-            errors.append(f"LLM_PROVIDER must be 'openai' or 'anthropic', got: {self.llm_provider}")
+        errors = [
+            message.format(config=self)
+            for is_invalid, message in _VALIDATION_RULES
+            if is_invalid(self)
+        ]
         
         if errors:
             raise ValueError(
@@ -88,31 +176,21 @@ class Config:
             )
     
     def get_output_path(self) -> Path:
-        """Get the output directory path."""
-        project_root = Path(__file__).parent.parent.parent
-        output_path = project_root / self.output_dir
-        output_path.mkdir(parents=True, exist_ok=True)
-        return output_path
+        """Get the output directory path (created on first call)."""
+        if not hasattr(self, "_output_path_cached"):
+            output_path = _PROJECT_ROOT / self.output_dir
+            output_path.mkdir(parents=True, exist_ok=True)
+            # Internal cache, written past the frozen guard
+            object.__setattr__(self, "_output_path_cached", output_path)
+        return self._output_path_cached
     
     def __repr__(self) -> str:
         """String representation of configuration (hides API keys)."""
-        return (
-            f"Config("
-            f"llm_provider={self.llm_provider}, "
-            f"llm_model={self.llm_model}, "
-            f"output_dir={self.output_dir}, "
-            f"google_places_max_results={self.google_places_max_results}, "
-            f"competitor_analysis_max_competitors={self.competitor_analysis_max_competitors}, "
-            f"website_scraper_timeout={self.website_scraper_timeout}, "
-            f"content_generation_temperature={self.content_generation_temperature}, "
-            f"competitor_analysis_temperature={self.competitor_analysis_temperature}, "
-            f"log_level={self.log_level}"
-            f")"
-        )
+        return self._repr
 
 
-# Global configuration instance (will be initialized when imported)
-_config: Optional[Config] = None
+# Configuration instances keyed by env_file (created on first use)
+_config_cache: Dict[Optional[str], Config] = {}
 
 
 def get_config(env_file: Optional[str] = None) -> Config:
@@ -123,10 +201,20 @@ def get_config(env_file: Optional[str] = None) -> Config:
         env_file: Optional path to .env file for initialization.
     
     Returns:
-        Config instance.
+        Config instance (one per env_file, reused on later calls).
     """
-    global _config
-    if _config is None:
-        _config = Config(env_file)
-    return _config
+    config = _config_cache.get(env_file)
+    if config is None:
+        config = _config_cache[env_file] = Config(env_file)
+    return config
 
+
+def clear_config_cache() -> None:
+    """
+    Forget cached configuration so the next get_config() reloads it.
+    
+    Also forgets which .env files were loaded, so they are read again. As on
+    first load, .env values never override variables already in the environment.
+    """
+    _config_cache.clear()
+    _dotenv_loaded.clear()
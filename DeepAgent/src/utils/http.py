@@ -0,0 +1,96 @@
+"""Shared HTTP session helpers for services that make outbound requests."""
+
+import functools
+from typing import Dict, Optional
+from urllib.parse import ParseResult, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connection pool size per host; large enough for concurrent checks/scrapes
+POOL_SIZE = 64
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_url(url: str) -> ParseResult:
+    """
+    Parse a URL, caching the result.
+    
+    The same business URLs are parsed by the website checker and the scraper
+    (host grouping, validation, link resolution); ParseResult is an immutable
+    tuple, so cached results are safe to share.
+    
+    Args:
+        url: URL string to parse.
+        
+    Returns:
+        Parsed URL components.
+    """
+    return urlparse(url)
+
+
+def ensure_scheme(url: str) -> str:
+    """
+    Return url with https:// prepended unless it already has an http(s) scheme.
+    
+    The scheme check goes through the parse_url cache and is case-insensitive,
+    so "HTTP://example.com" is left alone rather than double-prefixed.
+    
+    Args:
+        url: URL string, with or without a scheme.
+        
+    Returns:
+        URL with an http or https scheme.
+    """
+    if parse_url(url).scheme in ('http', 'https'):
+        return url
+    return 'https://' + url
+
+
+def create_session(
+    user_agent: str,
+    headers: Optional[Dict[str, str]] = None
+) -> requests.Session:
+    """
+    Create a requests session with pooled keep-alive connections.
+    
+    Reusing one session per service avoids a new TCP + TLS handshake for
+    every request. Connection failures and transient 429/5xx responses are
+    retried a couple of times with a short backoff. Retry-After headers are
+    ignored: urllib3 would sleep for whatever a third-party site asks, with
+    no cap and outside the request timeout.
+    
+    HTTP/1.1 keep-alive is enough here: scrapes and checks fan out across
+    different hosts, and same-host requests are deliberately spaced out, so
+    HTTP/2 multiplexing would rarely have two streams to share a connection.
+    
+    Args:
+        user_agent: User-Agent header sent with every request.
+        headers: Optional additional default headers.
+        
+    Returns:
+        Configured requests.Session instance.
+    """
+    session = requests.Session()
+    
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    session.headers.update({'User-Agent': user_agent})
+    if headers:
+        session.headers.update(headers)
+    
+    return session
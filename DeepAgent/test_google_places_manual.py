@@ -12,12 +12,13 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.config import get_config
-from src.services.google_places import GooglePlacesService
-
 
 def main():
     """Run manual tests against real Google Places API."""
+    # Imported here so importing this module (e.g. during test discovery) stays cheap
+    from src.utils.config import get_config
+    from src.services.google_places import GooglePlacesService
+    
     print("=" * 80)
     print("Google Places Service - Manual Test")
     print("=" * 80)
@@ -79,31 +80,37 @@ def main():
         print()
         
         for idx, business in enumerate(businesses, 1):
-            print(f"Business #{idx}")
-            print("-" * 80)
-            print(f"  Name:           {business.name}")
-            print(f"  Address:        {business.address}")
-            print(f"  Phone:          {business.phone or 'N/A'}")
-            print(f"  Website:        {business.website_url or 'N/A'}")
-            print(f"  Rating:         {business.rating or 'N/A'}")
-            print(f"  Place ID:       {business.google_place_id}")
-            print(f"  Industry:       {business.industry}")
-            print(f"  Location:       {business.city}, {business.state}")
-            print(f"  Coordinates:    ({business.latitude}, {business.longitude})" 
-                  if business.latitude and business.longitude else "  Coordinates:    N/A")
-            print(f"  Status:         {business.business_status or 'N/A'}")
-            print(f"  Price Level:    {business.price_level or 'N/A'}")
-            print(f"  Types:          {', '.join(business.types) if business.types else 'N/A'}")
-            print(f"  Reviews:        {len(business.reviews)} review(s)")
+            # Build each business block and write it in one call
+            coordinates = (
+                f"({business.latitude}, {business.longitude})"
+                if business.latitude and business.longitude else "N/A"
+            )
+            lines = [
+                f"Business #{idx}",
+                "-" * 80,
+                f"  Name:           {business.name}",
+                f"  Address:        {business.address}",
+                f"  Phone:          {business.phone or 'N/A'}",
+                f"  Website:        {business.website_url or 'N/A'}",
+                f"  Rating:         {business.rating or 'N/A'}",
+                f"  Place ID:       {business.google_place_id}",
+                f"  Industry:       {business.industry}",
+                f"  Location:       {business.city}, {business.state}",
+                f"  Coordinates:    {coordinates}",
+                f"  Status:         {business.business_status or 'N/A'}",
+                f"  Price Level:    {business.price_level or 'N/A'}",
+                f"  Types:          {', '.join(business.types) if business.types else 'N/A'}",
+                f"  Reviews:        {len(business.reviews)} review(s)",
+            ]
             if business.reviews:
-                print("    Recent reviews:")
+                lines.append("    Recent reviews:")
                 for review in business.reviews[:3]:  # Show first 3
                     author = review.get('author_name', 'Anonymous')
                     rating = review.get('rating', 'N/A')
                     text = review.get('text', '')[:100]  # First 100 chars
-                    print(f"      - {author} ({rating}/5): {text}...")
-            print(f"  Has Website:    {business.has_website}")
-            print()
+                    lines.append(f"      - {author} ({rating}/5): {text}...")
+            lines.append(f"  Has Website:    {business.has_website}")
+            sys.stdout.write("\n".join(lines) + "\n\n")
         
         print("=" * 80)
         print("[OK] Manual test completed successfully!")
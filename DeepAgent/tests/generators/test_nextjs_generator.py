@@ -1,20 +1,20 @@
 """Unit tests for NextJSGenerator, especially _escape_js and template data escaping."""
 
+import re
+
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from src.generators.nextjs_generator import NextJSGenerator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
-    config = MagicMock()
-    config.get_output_path.return_value = Path("/tmp/generated_sites")
-    return config
+    return SimpleNamespace(get_output_path=lambda: Path("/tmp/generated_sites"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator(mock_config):
     return NextJSGenerator(mock_config)
 
@@ -22,42 +22,34 @@ def generator(mock_config):
 class TestEscapeJs:
     """Tests for _escape_js to prevent JS/TS string literal syntax errors."""
 
-    def test_escapes_apostrophe(self, generator):
-        s = "We've got your back"
-        out = generator._escape_js(s)
-        # Apostrophe must be escaped as \' so it is safe inside single-quoted JS string
-        assert "\\'" in out
-        # When wrapped in single quotes, no unescaped ' in the middle
-        js_literal = "'" + out + "'"
-        assert js_literal.startswith("'") and js_literal.endswith("'")
-
-    def test_escapes_double_quote(self, generator):
-        s = 'Say "hello"'
-        out = generator._escape_js(s)
-        assert '\\"' in out
-
-    def test_escapes_backslash(self, generator):
-        s = "path\\to\\file"
-        out = generator._escape_js(s)
-        # Each backslash in the string should become \\
-        assert "\\\\" in out
-        assert "\\t" not in out or "\\\\" in out  # backslashes are escaped
-
-    def test_escapes_newline(self, generator):
-        s = "line1\nline2"
-        out = generator._escape_js(s)
-        assert "\n" not in out
-        assert "\\n" in out
-
-    def test_none_returns_empty(self, generator):
-        assert generator._escape_js(None) == ""
-
-    def test_non_string_coerced_and_escaped(self, generator):
-        assert generator._escape_js(42) == "42"
-        assert generator._escape_js(3.14) == "3.14"
-
-    def test_empty_string_returns_empty(self, generator):
-        assert generator._escape_js("") == ""
+    @pytest.mark.parametrize(
+        "value, must_contain, must_not_contain, expected",
+        [
+            # Apostrophe must be escaped as \' so it is safe inside single-quoted JS string
+            ("We've got your back", ["\\'"], [], None),
+            ('Say "hello"', ['\\"'], [], None),
+            # Each backslash in the string should become \\
+            ("path\\to\\file", ["\\\\"], [], None),
+            ("line1\nline2", ["\\n"], ["\n"], None),
+            (None, [], [], ""),
+            ("", [], [], ""),
+            # Non-strings are coerced and escaped
+            (42, [], [], "42"),
+            (3.14, [], [], "3.14"),
+        ],
+        ids=[
+            "apostrophe", "double_quote", "backslash", "newline",
+            "none", "empty_string", "int", "float",
+        ],
+    )
+    def test_escape_js(self, generator, value, must_contain, must_not_contain, expected):
+        out = generator._escape_js(value)
+        for fragment in must_contain:
+            assert fragment in out
+        for fragment in must_not_contain:
+            assert fragment not in out
+        if expected is not None:
+            assert out == expected
 
     def test_safe_inside_single_quoted_js_string(self, generator):
         """Escaped value used in '...' must not break JS parsing (no unescaped ')."""
@@ -66,9 +58,5 @@ class TestEscapeJs:
         # Simulate template output: title: '{{ value }}'
         js_literal = "'" + out + "'"
         # Should not contain an unescaped single quote in the middle
-        i = 1
-        while i < len(js_literal) - 1:
-            if js_literal[i] == "'" and (i == 0 or js_literal[i - 1] != "\\"):
-                pytest.fail(f"Unescaped quote at position {i} in {js_literal!r}")
-            i += 1
+        assert re.search(r"(?<!\\)'", js_literal[1:-1]) is None, f"Unescaped quote in {js_literal!r}"
         assert out != problematic
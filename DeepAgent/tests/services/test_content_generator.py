@@ -0,0 +1,349 @@
+"""Unit tests for content generator service."""
+
+import copy
+import hashlib
+import threading
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+from openai import RateLimitError
+
+from src.models.business import Business, WebsiteRequirements
+from src.services import content_generator
+from src.services.content_generator import ContentGeneratorService, _TopLevelJSONScanner
+
+
+@pytest.fixture(scope="module")
+def mock_config():
+    """Create a config for an OpenAI-backed generator (the client is never called)."""
+    return SimpleNamespace(
+        llm_provider='openai',
+        openai_api_key='test_api_key',
+        llm_model='gpt-4o-mini'
+    )
+
+
+@pytest.fixture(scope="module")
+def service(mock_config):
+    """Create a ContentGeneratorService."""
+    return ContentGeneratorService(mock_config)
+
+
+@pytest.fixture(scope="module")
+def requirements():
+    """Website requirements without primary services, so the LLM picks the services."""
+    business = Business(
+        name='ABC Roofing Company',
+        address='123 Main St, Austin, TX 78701',
+        industry='roofing',
+        city='Austin',
+        state='TX'
+    )
+    return WebsiteRequirements(business=business)
+
+
+def _services(*names):
+    """Build content services with the given names."""
+    return [{'name': name, 'description': '', 'features': []} for name in names]
+
+
+def _chunks(text, size):
+    """Split streamed text into LLM chunks of at most size characters."""
+    return [SimpleNamespace(content=text[i:i + size]) for i in range(0, len(text), size)]
+
+
+STREAMED_CONTENT = {
+    'business_info': {'name': 'ABC Roofing Company', 'tagline': 'Roofs {done} "right"'},
+    'about_content': {'title': 'About Us', 'description': 'Family owned since 1999.'},
+    'services': _services('Roof Repair', 'Roof Replacement'),
+}
+
+DESIGN = {
+    'design_theme': {'primary_color': '#123456'},
+    'image_keywords': {'hero': 'roof', 'services': ['repair', 'replacement']},
+}
+
+
+class TestImageKeywordAlignment:
+    """Test that service image keywords line up with the generated services."""
+    
+    @pytest.mark.parametrize(
+        "service_keywords, expected",
+        [
+            (['roof repair'], ['roof repair', 'Roof Replacement', 'Gutters']),
+            (['a', 'b', 'c', 'd', 'e'], ['a', 'b', 'c']),
+            ([], ['Roof Repair', 'Roof Replacement', 'Gutters']),
+        ],
+        ids=['padded_with_service_names', 'trimmed', 'missing']
+    )
+    def test_service_keywords_match_services(self, service, requirements, service_keywords, expected):
+        """Test that image_keywords.services has exactly one keyword per service."""
+        content = {
+            'services': _services('Roof Repair', 'Roof Replacement', 'Gutters'),
+            'image_keywords': {'services': service_keywords}
+        }
+        
+        content = service._validate_and_enhance_content(content, requirements)
+        
+        assert content['image_keywords']['services'] == expected
+
+
+@pytest.fixture
+def mock_prompts(mocker, service):
+    """Patch _generate_with_llm with per-prompt results: set content/design to a dict, None or an Event."""
+    results = {'content': copy.deepcopy(STREAMED_CONTENT), 'design': copy.deepcopy(DESIGN)}
+    
+    def generate(prompt):
+        result = results['design' if prompt == 'design prompt' else 'content']
+        if isinstance(result, threading.Event):
+            # Stand-in for a slow LLM call; bounded so a regression cannot hang the suite
+            result.wait(5)
+            return DESIGN
+        return result
+    
+    mocker.patch.object(service, '_create_content_generation_prompt', return_value='content prompt')
+    mocker.patch.object(service, '_create_design_prompt', return_value='design prompt')
+    mocker.patch.object(service, '_generate_with_llm', side_effect=generate)
+    return results
+
+
+class TestGenerateWebsiteContent:
+    """Test merging of the concurrent content and design calls."""
+    
+    def test_design_merged_into_content(self, service, requirements, mock_prompts):
+        """Test that design sections from the design call end up in the result."""
+        content = service.generate_website_content(requirements)
+        
+        assert content['business_info']['tagline'] == STREAMED_CONTENT['business_info']['tagline']
+        assert content['design_theme']['primary_color'] == '#123456'
+        assert content['image_keywords']['services'] == ['repair', 'replacement']
+    
+    def test_design_failure_keeps_content(self, service, requirements, mock_prompts):
+        """Test that a failed design call only falls back to the default design."""
+        mock_prompts['design'] = None
+        
+        content = service.generate_website_content(requirements)
+        
+        assert content['business_info']['tagline'] == STREAMED_CONTENT['business_info']['tagline']
+        assert content['design_theme'] == {
+            'font_heading': 'Inter',
+            'font_body': 'Inter',
+            'layout_style': 'hero-centered',
+            'theme_name': 'Professional',
+        }
+        assert content['image_keywords']['services'] == ['Roof Repair', 'Roof Replacement']
+    
+    def test_content_failure_does_not_wait_for_design(self, service, requirements, mock_prompts):
+        """Test that a failed content call returns defaults without awaiting the design call."""
+        release = threading.Event()
+        mock_prompts['content'] = None
+        mock_prompts['design'] = release
+        
+        try:
+            start = time.monotonic()
+            content = service.generate_website_content(requirements)
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+        
+        assert elapsed < 2
+        assert content == service._create_default_content(requirements)
+
+
+class TestTopLevelJSONScanner:
+    """Test incremental scanning of a streamed JSON object."""
+    
+    TEXT = orjson.dumps(STREAMED_CONTENT).decode()
+    
+    @pytest.mark.parametrize("size", [1, 7, 64, 10_000])
+    def test_chunk_boundaries(self, size):
+        """Test that members come out in order however the text is split."""
+        scanner = _TopLevelJSONScanner()
+        
+        members = [member for chunk in _chunks(self.TEXT, size) for member in scanner.feed(chunk.content)]
+        
+        assert members == list(STREAMED_CONTENT.items())
+        assert scanner.done
+    
+    def test_member_emitted_once_complete(self):
+        """Test that a member is emitted as soon as its value closes, not at the end."""
+        scanner = _TopLevelJSONScanner()
+        
+        assert scanner.feed('{"a": {"b": [1, 2') == []
+        assert scanner.feed(']}, "c": ') == [('a', {'b': [1, 2]})]
+        assert scanner.feed('3}') == [('c', 3)]
+        assert scanner.done
+    
+    def test_braces_and_escaped_quotes_in_strings(self):
+        """Test that braces, commas and escaped quotes inside strings do not end a member."""
+        scanner = _TopLevelJSONScanner()
+        
+        members = scanner.feed(r'{"a": "x}\"{,", "b": "\\", "c": {"d": "]"}}')
+        
+        assert members == [('a', 'x}"{,'), ('b', '\\'), ('c', {'d': ']'})]
+        assert scanner.done
+    
+    def test_code_fence_preamble_ignored(self):
+        """Test that text before the opening brace and after the closing brace is skipped."""
+        scanner = _TopLevelJSONScanner()
+        
+        members = scanner.feed('Here you go:\n```json\n') + scanner.feed('{"a": 1}\n```\n{"b": 2}')
+        
+        assert members == [('a', 1)]
+        assert scanner.done
+
+
+class TestGenerateWebsiteContentStream:
+    """Test section streaming and fallbacks in generate_website_content_stream."""
+    
+    @pytest.fixture
+    def mock_llm(self, mocker, service):
+        """Replace the LLM client used for the streamed content call."""
+        return mocker.patch.object(service, 'llm')
+    
+    @pytest.fixture
+    def mock_design(self, mocker, service):
+        """Replace the design call with a fixed result."""
+        return mocker.patch.object(service, '_generate_with_llm', return_value=DESIGN)
+    
+    def test_sections_yielded_in_order_then_defaults(self, service, requirements, mock_llm, mock_design):
+        """Test that streamed sections come first, in order, followed by the remaining sections."""
+        mock_llm.stream.return_value = _chunks(orjson.dumps(STREAMED_CONTENT).decode(), 5)
+        
+        sections = list(service.generate_website_content_stream(requirements))
+        names = [name for name, _ in sections]
+        
+        assert sections[:3] == list(STREAMED_CONTENT.items())
+        assert len(names) == len(set(names))
+        assert {'design_theme', 'image_keywords'} <= set(names[3:])
+        
+        content = dict(sections)
+        assert content['design_theme']['primary_color'] == '#123456'
+        assert content['image_keywords']['services'] == ['repair', 'replacement']
+        assert set(service._create_default_content(requirements)) <= set(names)
+    
+    def test_fallback_after_mid_stream_error(self, service, requirements, mock_llm, mock_design):
+        """Test that a stream failure keeps what was sent and fills the rest from defaults."""
+        business_info = STREAMED_CONTENT['business_info']
+        
+        def broken_stream(prompt):
+            yield SimpleNamespace(content='{"business_info": ' + orjson.dumps(business_info).decode())
+            yield SimpleNamespace(content=', "about_content": {"title": "Ab')
+            raise ConnectionError('stream dropped')
+        
+        mock_llm.stream.side_effect = broken_stream
+        
+        sections = list(service.generate_website_content_stream(requirements))
+        defaults = service._create_default_content(requirements)
+        
+        assert sections[0] == ('business_info', business_info)
+        assert [name for name, _ in sections[1:]] == [name for name in defaults if name != 'business_info']
+        assert dict(sections[1:]) == {name: value for name, value in defaults.items() if name != 'business_info'}
+    
+    
+    def test_stream_failure_does_not_wait_for_design(self, service, requirements, mock_llm, mock_prompts):
+        """Test that the fallback after a stream failure does not await the design call."""
+        release = threading.Event()
+        mock_prompts['design'] = release
+        mock_llm.stream.side_effect = ConnectionError('stream dropped')
+        
+        try:
+            start = time.monotonic()
+            sections = dict(service.generate_website_content_stream(requirements))
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+        
+        assert elapsed < 2
+        assert sections == service._create_default_content(requirements)
+
+
+class TestInflightSharing:
+    """Test that identical concurrent prompts share one LLM call."""
+    
+    PROMPT = 'Generate content for ABC Roofing'
+    KEY = hashlib.sha256(PROMPT.encode('utf-8')).hexdigest()
+    
+    def test_waiter_gets_deep_copy(self, mocker, monkeypatch, service):
+        """Test that a caller joining an in-flight prompt gets its own copy of the result."""
+        call_llm = mocker.patch.object(service, '_call_llm_for_json')
+        future = Future()
+        future.set_result({'services': _services('Roof Repair')})
+        monkeypatch.setitem(content_generator._inflight, self.KEY, future)
+        
+        content = service._generate_with_llm(self.PROMPT)
+        content['services'][0]['name'] = 'Changed'
+        
+        call_llm.assert_not_called()
+        assert future.result() == {'services': _services('Roof Repair')}
+        assert service._generate_with_llm(self.PROMPT) == {'services': _services('Roof Repair')}
+    
+    def test_leader_publishes_snapshot_and_clears_entry(self, mocker, service):
+        """Test that the leader's later edits do not reach waiters and the entry is removed."""
+        published = {}
+        
+        def call_llm(prompt):
+            published['future'] = content_generator._inflight[self.KEY]
+            return {'services': _services('Roof Repair')}
+        
+        mocker.patch.object(service, '_call_llm_for_json', side_effect=call_llm)
+        
+        content = service._generate_with_llm(self.PROMPT)
+        content['services'][0]['name'] = 'Changed'
+        
+        assert published['future'].result() == {'services': _services('Roof Repair')}
+        assert self.KEY not in content_generator._inflight
+
+
+def _rate_limit_error():
+    """Build the error the OpenAI SDK raises for a 429 response."""
+    request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+    return RateLimitError('Rate limit reached', response=httpx.Response(429, request=request), body=None)
+
+
+class TestInvokeLLMRetries:
+    """Test that _invoke_llm is the only retry layer for LLM calls."""
+    
+    @pytest.fixture
+    def mock_sleep(self, mocker):
+        """Skip the backoff sleeps between attempts."""
+        return mocker.patch.object(ContentGeneratorService._invoke_llm.retry, 'sleep')
+    
+    def test_sdk_retries_disabled(self, service):
+        """Test that the OpenAI client does not retry on its own."""
+        assert service.llm.max_retries == 0
+    
+    def test_rate_limit_retried_then_succeeds(self, mocker, service, mock_sleep):
+        """Test that a 429 is retried with backoff and the next response is returned."""
+        mock_llm = mocker.patch.object(service, 'llm')
+        mock_llm.invoke.side_effect = [_rate_limit_error(), SimpleNamespace(content='{}')]
+        
+        assert service._invoke_llm('prompt').content == '{}'
+        assert mock_llm.invoke.call_count == 2
+        assert mock_sleep.call_count == 1
+    
+    def test_rate_limit_reraised_after_last_attempt(self, mocker, service, mock_sleep):
+        """Test that the error is re-raised once every attempt has failed."""
+        mock_llm = mocker.patch.object(service, 'llm')
+        mock_llm.invoke.side_effect = _rate_limit_error()
+        
+        with pytest.raises(RateLimitError):
+            service._invoke_llm('prompt')
+        
+        assert mock_llm.invoke.call_count == 5
+        assert mock_sleep.call_count == 4
+    
+    def test_other_errors_not_retried(self, mocker, service, mock_sleep):
+        """Test that non-transient errors fail on the first attempt."""
+        mock_llm = mocker.patch.object(service, 'llm')
+        mock_llm.invoke.side_effect = ValueError('bad request')
+        
+        with pytest.raises(ValueError):
+            service._invoke_llm('prompt')
+        
+        assert mock_llm.invoke.call_count == 1
+        mock_sleep.assert_not_called()
@@ -1,207 +1,369 @@
 """Comprehensive unit tests for Google Places service."""
 
+import sqlite3
+
+import orjson
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from googlemaps.exceptions import ApiError, HTTPError, Timeout
+from types import MappingProxyType, SimpleNamespace
+
+# The service under test wraps the googlemaps client; skip this module cleanly
+# (instead of failing collection) where googlemaps is not installed
+pytest.importorskip("googlemaps")
+
+from googlemaps import Client as MapsClient
+import requests
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
 
 from src.services.google_places import GooglePlacesService
 from src.models.business import Business
-from src.utils.config import Config
 
 
-# Sample mock data matching Google Places API structure
-SAMPLE_PLACE_SEARCH_RESULT = {
-    'results': [
+# Sample mock data matching Google Places API structure, kept as raw JSON and
+# parsed once into read-only views shared by every test
+_SAMPLE_PLACE_SEARCH_RESULT_JSON = b'''{
+    "results": [
         {
-            'place_id': 'ChIJN1t_tDeuEmsRUsoyG83frY4',
-            'name': 'ABC Roofing Company',
-            'formatted_address': '123 Main St, Austin, TX 78701, USA',
-            'geometry': {
-                'location': {'lat': 30.2672, 'lng': -97.7431}
+            "place_id": "ChIJN1t_tDeuEmsRUsoyG83frY4",
+            "name": "ABC Roofing Company",
+            "formatted_address": "123 Main St, Austin, TX 78701, USA",
+            "geometry": {
+                "location": {"lat": 30.2672, "lng": -97.7431}
             },
-            'rating': 4.5,
-            'types': ['roofing_contractor', 'establishment', 'point_of_interest'],
-            'business_status': 'OPERATIONAL',
-            'price_level': 2
+            "rating": 4.5,
+            "types": ["roofing_contractor", "establishment", "point_of_interest"],
+            "business_status": "OPERATIONAL",
+            "price_level": 2
         },
         {
-            'place_id': 'ChIJXxXxXxXxXxXxXxXxXxXxXx',
-            'name': 'XYZ Roofing Services',
-            'formatted_address': '456 Oak Ave, Austin, TX 78702, USA',
-            'geometry': {
-                'location': {'lat': 30.2680, 'lng': -97.7440}
+            "place_id": "ChIJXxXxXxXxXxXxXxXxXxXxXx",
+            "name": "XYZ Roofing Services",
+            "formatted_address": "456 Oak Ave, Austin, TX 78702, USA",
+            "geometry": {
+                "location": {"lat": 30.2680, "lng": -97.7440}
             },
-            'rating': 4.8,
-            'types': ['roofing_contractor', 'establishment'],
-            'business_status': 'OPERATIONAL',
-            'price_level': 3
+            "rating": 4.8,
+            "types": ["roofing_contractor", "establishment"],
+            "business_status": "OPERATIONAL",
+            "price_level": 3
         }
     ],
-    'status': 'OK'
-}
-
-SAMPLE_PLACE_DETAILS_1 = {
-    'result': {
-        'place_id': 'ChIJN1t_tDeuEmsRUsoyG83frY4',
-        'name': 'ABC Roofing Company',
-        'formatted_address': '123 Main St, Austin, TX 78701, USA',
-        'international_phone_number': '+1-512-555-0123',
-        'formatted_phone_number': '(512) 555-0123',
-        'website': 'https://www.abcroofing.com',
-        'rating': 4.5,
-        'geometry': {
-            'location': {'lat': 30.2672, 'lng': -97.7431}
+    "status": "OK"
+}'''
+
+# Reviews run newest to oldest; the sixth (oldest) review should be filtered out
+_SAMPLE_PLACE_DETAILS_1_JSON = b'''{
+    "result": {
+        "place_id": "ChIJN1t_tDeuEmsRUsoyG83frY4",
+        "name": "ABC Roofing Company",
+        "formatted_address": "123 Main St, Austin, TX 78701, USA",
+        "international_phone_number": "+1-512-555-0123",
+        "formatted_phone_number": "(512) 555-0123",
+        "website": "https://www.abcroofing.com",
+        "rating": 4.5,
+        "geometry": {
+            "location": {"lat": 30.2672, "lng": -97.7431}
         },
-        'business_status': 'OPERATIONAL',
-        'price_level': 2,
-        'types': ['roofing_contractor', 'establishment', 'point_of_interest'],
-        'reviews': [
+        "business_status": "OPERATIONAL",
+        "price_level": 2,
+        "types": ["roofing_contractor", "establishment", "point_of_interest"],
+        "reviews": [
             {
-                'author_name': 'John Doe',
-                'rating': 5,
-                'text': 'Great service!',
-                'time': 1609459200  # Most recent
+                "author_name": "John Doe",
+                "rating": 5,
+                "text": "Great service!",
+                "time": 1609459200
             },
             {
-                'author_name': 'Jane Smith',
-                'rating': 4,
-                'text': 'Good work',
-                'time': 1609372800
+                "author_name": "Jane Smith",
+                "rating": 4,
+                "text": "Good work",
+                "time": 1609372800
             },
             {
-                'author_name': 'Bob Johnson',
-                'rating': 5,
-                'text': 'Excellent!',
-                'time': 1609286400
+                "author_name": "Bob Johnson",
+                "rating": 5,
+                "text": "Excellent!",
+                "time": 1609286400
             },
             {
-                'author_name': 'Alice Brown',
-                'rating': 4,
-                'text': 'Very professional',
-                'time': 1609200000
+                "author_name": "Alice Brown",
+                "rating": 4,
+                "text": "Very professional",
+                "time": 1609200000
             },
             {
-                'author_name': 'Charlie Wilson',
-                'rating': 5,
-                'text': 'Amazing!',
-                'time': 1609113600
+                "author_name": "Charlie Wilson",
+                "rating": 5,
+                "text": "Amazing!",
+                "time": 1609113600
             },
             {
-                'author_name': 'Diana Lee',
-                'rating': 4,
-                'text': 'Satisfied customer',
-                'time': 1609027200  # Oldest (should be filtered out)
+                "author_name": "Diana Lee",
+                "rating": 4,
+                "text": "Satisfied customer",
+                "time": 1609027200
             }
         ]
     }
-}
-
-SAMPLE_PLACE_DETAILS_2 = {
-    'result': {
-        'place_id': 'ChIJXxXxXxXxXxXxXxXxXxXxXx',
-        'name': 'XYZ Roofing Services',
-        'formatted_address': '456 Oak Ave, Austin, TX 78702, USA',
-        'international_phone_number': '+1-512-555-0456',
-        'website': 'https://www.xyzroofing.com',
-        'rating': 4.8,
-        'geometry': {
-            'location': {'lat': 30.2680, 'lng': -97.7440}
+}'''
+
+_SAMPLE_PLACE_DETAILS_2_JSON = b'''{
+    "result": {
+        "place_id": "ChIJXxXxXxXxXxXxXxXxXxXxXx",
+        "name": "XYZ Roofing Services",
+        "formatted_address": "456 Oak Ave, Austin, TX 78702, USA",
+        "international_phone_number": "+1-512-555-0456",
+        "website": "https://www.xyzroofing.com",
+        "rating": 4.8,
+        "geometry": {
+            "location": {"lat": 30.2680, "lng": -97.7440}
         },
-        'business_status': 'OPERATIONAL',
-        'price_level': 3,
-        'types': ['roofing_contractor', 'establishment'],
-        'reviews': []
+        "business_status": "OPERATIONAL",
+        "price_level": 3,
+        "types": ["roofing_contractor", "establishment"],
+        "reviews": []
     }
-}
+}'''
 
+SAMPLE_PLACE_SEARCH_RESULT = MappingProxyType(orjson.loads(_SAMPLE_PLACE_SEARCH_RESULT_JSON))
+SAMPLE_PLACE_DETAILS_1 = MappingProxyType(orjson.loads(_SAMPLE_PLACE_DETAILS_1_JSON))
+SAMPLE_PLACE_DETAILS_2 = MappingProxyType(orjson.loads(_SAMPLE_PLACE_DETAILS_2_JSON))
 
-@pytest.fixture
+# Search response holding only the first sample place (built once, shared by tests)
+SINGLE_PLACE_SEARCH_RESULT = MappingProxyType({
+    'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
+})
+
+
+# Client errors raised by the mocks (built once, reused through side_effect)
+_API_ERROR = ApiError('API Error')
+
+_RATE_LIMIT_ERROR = ApiError('Rate limit exceeded')
+_RATE_LIMIT_ERROR.status = 429
+
+_HTTP_500 = HTTPError('HTTP Error')
+_HTTP_500.status_code = 500  # HTTPError requires status_code
+
+_TIMEOUT = Timeout('Timeout Error')
+
+
+def _details_by_place_id(responses):
+    """
+    Build a place() side effect that looks up each response by place_id.
+    
+    Exception values are raised instead of returned.
+    """
+    def side_effect(place_id, **kwargs):
+        response = responses[place_id]
+        if isinstance(response, Exception):
+            raise response
+        return response
+    return side_effect
+
+
+def _make_config(**overrides):
+    """Build a fresh config namespace, so no test mutates state another test can see."""
+    settings = {
+        'google_places_api_key': 'test_api_key',
+        'google_places_max_results': 20,
+        'google_places_use_v1_search': False,
+        'place_details_cache_path': None,
+        'place_details_cache_ttl_days': 7,
+        'place_details_include_atmosphere': True,
+    }
+    settings.update(overrides)
+    return SimpleNamespace(**settings)
+
+
+@pytest.fixture(scope="module")
 def mock_config():
-    """Create a mock Config object for testing."""
-    config = Mock(spec=Config)
-    config.google_places_api_key = 'test_api_key'
-    config.google_places_max_results = 20
-    return config
+    """Create a read-only config for testing, shared by the module."""
+    return _make_config()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config_no_key():
-    """Create a mock Config object without API key."""
-    config = Mock(spec=Config)
-    config.google_places_api_key = None
-    config.google_places_max_results = 20
-    return config
+    """Create a config without API key."""
+    return _make_config(google_places_api_key=None)
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(mocker):
+    """Replace time.sleep with a recording no-op so backoff never slows the tests."""
+    return mocker.patch('src.services.google_places.time.sleep')
 
 
 @pytest.fixture
-def mock_googlemaps_client():
-    """Create a mock googlemaps.Client."""
-    client = Mock()
-    return client
+def mock_client_class(mocker):
+    """Replace googlemaps.Client for the test with a mock class."""
+    return mocker.patch(
+        'src.services.google_places.googlemaps.Client',
+        return_value=mocker.Mock(spec_set=MapsClient)
+    )
+
+
+@pytest.fixture
+def mock_client(mock_client_class):
+    """Mock googlemaps client returned to every service built in the test."""
+    return mock_client_class.return_value
+
+
+@pytest.fixture(scope="module")
+def shared_service(mock_config, module_mocker):
+    """Build one GooglePlacesService on a mock client for the whole module."""
+    client = module_mocker.Mock(spec_set=MapsClient)
+    module_mocker.patch('src.services.google_places.googlemaps.Client', return_value=client)
+    return GooglePlacesService(mock_config), client
+
+
+@pytest.fixture
+def patched_service(shared_service):
+    """Hand out the shared service with a freshly reset mock client."""
+    service, client = shared_service
+    client.reset_mock(return_value=True, side_effect=True)
+    return service, client
+
+
+@pytest.fixture
+def mock_client_setup(request, patched_service):
+    """
+    Configure the shared mock client from an indirect (search, details) parameter.
+    
+    A list of details responses is served in order; anything else is returned
+    for every Place Details call.
+    """
+    search_response, details_response = request.param
+    service, mock_client = patched_service
+    details_key = 'place.side_effect' if isinstance(details_response, list) else 'place.return_value'
+    mock_client.configure_mock(**{
+        'places.return_value': search_response,
+        details_key: details_response
+    })
+    return service, mock_client
 
 
 class TestServiceInitialization:
     """Test service initialization."""
     
-    def test_successful_initialization(self, mock_config):
+    def test_successful_initialization(self, mock_client_class, mock_config):
         """Test successful initialization with valid config."""
-        with patch('src.services.google_places.googlemaps.Client') as mock_client_class:
-            service = GooglePlacesService(mock_config)
-            
-            assert service.config == mock_config
-            assert service.max_results == 20
-            mock_client_class.assert_called_once_with(key='test_api_key')
+        service = GooglePlacesService(mock_config)
+        
+        assert service.config == mock_config
+        assert service.max_results == 20
+        mock_client_class.assert_called_once_with(key='test_api_key')
     
     def test_initialization_without_api_key(self, mock_config_no_key):
         """Test that ValueError is raised when API key is missing."""
         with pytest.raises(ValueError, match="Google Places API key is required"):
             GooglePlacesService(mock_config_no_key)
     
-    def test_max_results_set_from_config(self, mock_config):
+    def test_max_results_set_from_config(self, mock_client):
         """Test that max_results is set from config."""
-        mock_config.google_places_max_results = 10
-        with patch('src.services.google_places.googlemaps.Client'):
-            service = GooglePlacesService(mock_config)
-            assert service.max_results == 10
+        service = GooglePlacesService(_make_config(google_places_max_results=10))
+        assert service.max_results == 10
+
 
+# Minimal place payload shared by the place data cases
+_TEST_PLACE = {
+    'place_id': 'test_id',
+    'name': 'Test Business',
+    'formatted_address': '123 Test St',
+    'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
+}
 
-class TestSuccessfulBusinessSearch:
-    """Test successful business search scenarios."""
+# ((search response, details response), expected business count, expected Business fields)
+PLACE_DATA_CASES = [
+    pytest.param(
+        (
+            {'results': [{**_TEST_PLACE, 'rating': 4.0}]},
+            {'result': {**_TEST_PLACE, 'rating': 4.0}}  # No phone or website
+        ),
+        1,
+        {'phone': None, 'website_url': None},
+        id='missing_phone_and_website'
+    ),
+    pytest.param(
+        (
+            {'results': [_TEST_PLACE]},  # No rating
+            {'result': _TEST_PLACE}  # No rating or reviews
+        ),
+        1,
+        {'rating': None, 'reviews': []},
+        id='missing_reviews_and_rating'
+    ),
+    pytest.param(
+        (
+            {'results': [
+                {**_TEST_PLACE, 'place_id': 'valid_id', 'name': 'Valid Business'},
+                # Missing place_id
+                {'name': 'Invalid Business', 'formatted_address': '456 Test St',
+                 'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}}
+            ]},
+            {'result': {**_TEST_PLACE, 'place_id': 'valid_id', 'name': 'Valid Business'}}
+        ),
+        1,  # Should only return valid business
+        {'name': 'Valid Business'},
+        id='missing_place_id'
+    ),
+    pytest.param(
+        (
+            {'results': [{k: v for k, v in _TEST_PLACE.items() if k != 'name'}]},
+            {'result': {k: v for k, v in _TEST_PLACE.items() if k != 'name'}}
+        ),
+        0,  # Should skip invalid place
+        {},
+        id='missing_name'
+    ),
+    pytest.param(
+        (
+            {'results': [], 'status': 'OK'},
+            None
+        ),
+        0,
+        {},
+        id='empty_results_list'
+    ),
+    pytest.param(
+        (
+            {'status': 'ZERO_RESULTS'},
+            None
+        ),
+        0,
+        {},
+        id='no_results_key'
+    ),
+]
+
+
+class TestBusinessSearchResults:
+    """Test businesses built from complete, incomplete and empty search results."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_search_businesses_returns_list(self, mock_client_class, mock_config):
+    @pytest.mark.parametrize(
+        "mock_client_setup",
+        [(SAMPLE_PLACE_SEARCH_RESULT, [SAMPLE_PLACE_DETAILS_1, SAMPLE_PLACE_DETAILS_2])],
+        indirect=True
+    )
+    def test_search_businesses_returns_list(self, mock_client_setup):
         """Test that search_businesses returns a list of Business objects."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = SAMPLE_PLACE_SEARCH_RESULT
-        mock_client.place.side_effect = [
-            SAMPLE_PLACE_DETAILS_1,
-            SAMPLE_PLACE_DETAILS_2
-        ]
+        service, _ = mock_client_setup
         
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):  # Mock sleep to speed up tests
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         assert isinstance(businesses, list)
         assert len(businesses) == 2
-        assert all(isinstance(b, Business) for b in businesses)
+        assert all(type(b) is Business for b in businesses)
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_business_fields_populated_correctly(self, mock_client_class, mock_config):
+    @pytest.mark.parametrize(
+        "mock_client_setup",
+        [(SINGLE_PLACE_SEARCH_RESULT, SAMPLE_PLACE_DETAILS_1)],
+        indirect=True
+    )
+    def test_business_fields_populated_correctly(self, mock_client_setup):
         """Test that all Business fields are correctly populated."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
-        
-        service = GooglePlacesService(mock_config)
+        service, _ = mock_client_setup
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         assert len(businesses) == 1
         business = businesses[0]
@@ -222,132 +384,78 @@ class TestSuccessfulBusinessSearch:
         assert business.longitude == -97.7431
         assert business.business_status == 'OPERATIONAL'
         assert business.price_level == 2
-        assert business.has_website == False  # Set by Website Detection Agent later
-
-
-class TestMissingOptionalFields:
-    """Test handling of missing optional fields."""
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_missing_phone_and_website(self, mock_client_class, mock_config):
-        """Test business creation with missing phone and website."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [{
-                'place_id': 'test_id',
-                'name': 'Test Business',
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}},
-                'rating': 4.0
-            }]
-        }
-        mock_client.place.return_value = {
-            'result': {
-                'place_id': 'test_id',
-                'name': 'Test Business',
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}},
-                'rating': 4.0
-                # No phone or website
-            }
-        }
-        
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
-        
-        assert len(businesses) == 1
-        assert businesses[0].phone is None
-        assert businesses[0].website_url is None
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_missing_reviews_and_rating(self, mock_client_class, mock_config):
-        """Test business creation with missing reviews and rating."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [{
-                'place_id': 'test_id',
-                'name': 'Test Business',
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-                # No rating
-            }]
-        }
-        mock_client.place.return_value = {
-            'result': {
-                'place_id': 'test_id',
-                'name': 'Test Business',
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-                # No rating or reviews
-            }
-        }
-        
-        service = GooglePlacesService(mock_config)
+        # Taken from the listing's website; the Website Detection Agent may re-validate it
+        assert business.has_website is True
+    
+    @pytest.mark.parametrize(
+        "mock_client_setup, expected_count, expected_fields",
+        PLACE_DATA_CASES,
+        indirect=["mock_client_setup"]
+    )
+    def test_place_data(self, mock_client_setup, expected_count, expected_fields):
+        """Test the businesses built from incomplete or empty Places responses."""
+        service, _ = mock_client_setup
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        assert len(businesses) == 1
-        assert businesses[0].rating is None
-        assert businesses[0].reviews == []
+        assert isinstance(businesses, list)
+        assert len(businesses) == expected_count
+        for field, expected in expected_fields.items():
+            assert getattr(businesses[0], field) == expected
 
 
 class TestRateLimiting:
     """Test rate limiting functionality."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    @patch('time.sleep')
-    def test_sleep_called_between_calls(self, mock_sleep, mock_client_class, mock_config):
-        """Test that sleep is called between Place Details API calls."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [
-                SAMPLE_PLACE_SEARCH_RESULT['results'][0],
-                SAMPLE_PLACE_SEARCH_RESULT['results'][1]
+    def test_no_fixed_delay_between_calls(self, mock_sleep, patched_service):
+        """Test that Place Details calls are not separated by a fixed sleep."""
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': {
+                'results': [
+                    SAMPLE_PLACE_SEARCH_RESULT['results'][0],
+                    SAMPLE_PLACE_SEARCH_RESULT['results'][1]
+                ]
+            },
+            'place.side_effect': [
+                SAMPLE_PLACE_DETAILS_1,
+                SAMPLE_PLACE_DETAILS_2
             ]
-        }
-        mock_client.place.side_effect = [
-            SAMPLE_PLACE_DETAILS_1,
-            SAMPLE_PLACE_DETAILS_2
-        ]
+        })
         
-        service = GooglePlacesService(mock_config)
-        service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        # Should sleep once between 2 places (not after the last one)
-        assert mock_sleep.call_count == 1
-        mock_sleep.assert_called_with(0.15)
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    @patch('time.sleep')
-    def test_no_sleep_after_last_place(self, mock_sleep, mock_client_class, mock_config):
-        """Test that sleep is NOT called after the last place."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
+        assert len(businesses) == 2
+        assert mock_client.place.call_count == 2
+        assert mock_sleep.call_count == 0
+    
+    def test_results_keep_search_order(self, patched_service):
+        """Test that concurrently fetched businesses keep text search order."""
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': {
+                'results': [
+                    SAMPLE_PLACE_SEARCH_RESULT['results'][0],
+                    SAMPLE_PLACE_SEARCH_RESULT['results'][1]
+                ]
+            },
+            'place.side_effect': _details_by_place_id({
+                'ChIJN1t_tDeuEmsRUsoyG83frY4': SAMPLE_PLACE_DETAILS_1,
+                'ChIJXxXxXxXxXxXxXxXxXxXxXx': SAMPLE_PLACE_DETAILS_2
+            })
+        })
         
-        service = GooglePlacesService(mock_config)
-        service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        # Should not sleep for a single place
-        assert mock_sleep.call_count == 0
+        assert [b.name for b in businesses] == ['ABC Roofing Company', 'XYZ Roofing Services']
 
 
 class TestResultLimiting:
     """Test result limiting functionality."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_max_results_limit(self, mock_client_class, mock_config):
+    def test_max_results_limit(self, mock_client):
         """Test that only max_results businesses are returned."""
-        mock_config.google_places_max_results = 2
+        config = _make_config(google_places_max_results=2)
         
         # Create 5 places
         many_places = {
@@ -360,266 +468,386 @@ class TestResultLimiting:
             ]
         }
         
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = many_places
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
+        mock_client.configure_mock(**{
+            'places.return_value': many_places,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
         
-        service = GooglePlacesService(mock_config)
+        service = GooglePlacesService(config)
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         # Should only return 2 businesses (max_results)
         assert len(businesses) == 2
-
-
-class TestEmptySearchResults:
-    """Test handling of empty search results."""
+        assert mock_client.place.call_count == len({r['place_id'] for r in many_places['results']})
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_empty_results_list(self, mock_client_class, mock_config):
-        """Test handling of empty results list."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {'results': [], 'status': 'OK'}
-        
-        service = GooglePlacesService(mock_config)
+    def test_duplicate_places_fetched_once(self, patched_service):
+        """Test that repeated place_ids get one details call and one business."""
+        service, mock_client = patched_service
+        first, second = SAMPLE_PLACE_SEARCH_RESULT['results']
+        mock_client.configure_mock(**{
+            'places.return_value': {'results': [first, second, first, second, first]},
+            'place.side_effect': _details_by_place_id({
+                'ChIJN1t_tDeuEmsRUsoyG83frY4': SAMPLE_PLACE_DETAILS_1,
+                'ChIJXxXxXxXxXxXxXxXxXxXxXx': SAMPLE_PLACE_DETAILS_2
+            })
+        })
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
-        
-        assert businesses == []
-        assert isinstance(businesses, list)
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_no_results_key(self, mock_client_class, mock_config):
-        """Test handling of response without 'results' key."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {'status': 'ZERO_RESULTS'}
-        
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        assert businesses == []
+        assert mock_client.place.call_count == 2
+        assert [b.name for b in businesses] == ['ABC Roofing Company', 'XYZ Roofing Services']
 
 
 class TestAPIErrorHandling:
     """Test API error handling."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_api_error_raised(self, mock_client_class, mock_config):
+    def test_api_error_raised(self, patched_service):
         """Test that ApiError is logged and re-raised."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.side_effect = ApiError('API Error')
-        
-        service = GooglePlacesService(mock_config)
+        service, mock_client = patched_service
+        mock_client.places.side_effect = _API_ERROR
         
         with pytest.raises(ApiError):
             service.search_businesses("roofing", "Austin", "TX")
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_http_error_raised(self, mock_client_class, mock_config):
+    def test_http_error_raised(self, patched_service):
         """Test that HTTPError is logged and re-raised."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        http_error = HTTPError('HTTP Error')
-        http_error.status_code = 500  # HTTPError requires status_code
-        mock_client.places.side_effect = http_error
-        
-        service = GooglePlacesService(mock_config)
+        service, mock_client = patched_service
+        mock_client.places.side_effect = _HTTP_500
         
         with pytest.raises(HTTPError):
             service.search_businesses("roofing", "Austin", "TX")
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_timeout_error_raised(self, mock_client_class, mock_config):
+    def test_timeout_error_raised(self, patched_service):
         """Test that Timeout is logged and re-raised."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.side_effect = Timeout('Timeout Error')
-        
-        service = GooglePlacesService(mock_config)
+        service, mock_client = patched_service
+        mock_client.places.side_effect = _TIMEOUT
         
         with pytest.raises(Timeout):
             service.search_businesses("roofing", "Austin", "TX")
 
 
-class TestPlaceDetailsErrorHandling:
-    """Test Place Details API error handling."""
+class TestV1SearchErrors:
+    """Test error mapping for Places API (New) text search."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_place_details_returns_none(self, mock_client_class, mock_config):
-        """Test that business is still created when place details fails."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = None  # Simulate API failure
+    @pytest.fixture
+    def mock_post(self, mocker, mock_client):
+        """Patch the HTTP POST used by the v1 text search."""
+        return mocker.patch('src.services.google_places.requests.post')
+    
+    @pytest.fixture
+    def v1_service(self, mock_client):
+        """Create a service that searches with Places API (New)."""
+        return GooglePlacesService(_make_config(google_places_use_v1_search=True))
+    
+    def test_api_error_body(self, mocker, mock_post, v1_service):
+        """Test that a JSON error body becomes an ApiError with its status and message."""
+        mock_post.return_value = mocker.Mock(status_code=403, content=(
+            b'{"error": {"code": 403, "status": "PERMISSION_DENIED", "message": "API key invalid"}}'
+        ))
         
-        service = GooglePlacesService(mock_config)
+        with pytest.raises(ApiError) as exc_info:
+            v1_service.search_businesses("roofing", "Austin", "TX")
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        assert exc_info.value.status == 'PERMISSION_DENIED'
+        assert exc_info.value.message == 'API key invalid'
+    
+    @pytest.mark.parametrize(
+        "content",
+        [b'<html><body>502 Bad Gateway</body></html>', b'', b'[]'],
+        ids=['html', 'empty', 'not_an_object']
+    )
+    def test_non_json_error_body(self, mocker, mock_post, v1_service, content):
+        """Test that a non-200 response without a JSON error body becomes an HTTPError."""
+        mock_post.return_value = mocker.Mock(status_code=502, content=content)
+        
+        with pytest.raises(HTTPError) as exc_info:
+            v1_service.search_businesses("roofing", "Austin", "TX")
+        
+        assert exc_info.value.status_code == 502
+    
+    def test_invalid_json_success_body(self, mocker, mock_post, v1_service):
+        """Test that an unparseable 200 response becomes a TransportError."""
+        mock_post.return_value = mocker.Mock(status_code=200, content=b'<html></html>')
         
-        # Should still create business from text search data
-        assert len(businesses) == 1
-        assert businesses[0].name == 'ABC Roofing Company'
+        with pytest.raises(TransportError):
+            v1_service.search_businesses("roofing", "Austin", "TX")
+    
+    @pytest.mark.parametrize(
+        "raised, expected",
+        [
+            (requests.exceptions.ConnectTimeout(), Timeout),
+            (requests.exceptions.ReadTimeout(), Timeout),
+            (requests.exceptions.ConnectionError(), TransportError),
+            (requests.exceptions.RequestException(), TransportError),
+        ],
+        ids=['connect_timeout', 'read_timeout', 'connection_error', 'request_exception']
+    )
+    def test_request_exceptions_mapped(self, mock_post, v1_service, raised, expected):
+        """Test that requests exceptions map to googlemaps exceptions."""
+        mock_post.side_effect = raised
+        
+        with pytest.raises(expected):
+            v1_service.search_businesses("roofing", "Austin", "TX")
+
+
+# (search response, place() side effect, expected business names,
+#  expected place() calls, expected backoff sleeps)
+PLACE_DETAILS_SCENARIOS = [
+    # First call raises 429, retry succeeds
+    pytest.param(
+        SINGLE_PLACE_SEARCH_RESULT,
+        [_RATE_LIMIT_ERROR, SAMPLE_PLACE_DETAILS_1],
+        {'ABC Roofing Company'},
+        2,
+        1,
+        id='rate_limit_retry_succeeds'
+    ),
+    # Every call fails with 429: give up after the retry limit, keep text search data
+    pytest.param(
+        SINGLE_PLACE_SEARCH_RESULT,
+        _RATE_LIMIT_ERROR,
+        {'ABC Roofing Company'},
+        4,
+        3,
+        id='rate_limit_retry_fails'
+    ),
+    # First place details fails, second succeeds; both businesses are still returned
+    pytest.param(
+        SAMPLE_PLACE_SEARCH_RESULT,
+        _details_by_place_id({
+            'ChIJN1t_tDeuEmsRUsoyG83frY4': Exception("Place details error"),
+            'ChIJXxXxXxXxXxXxXxXxXxXxXx': SAMPLE_PLACE_DETAILS_2
+        }),
+        {'ABC Roofing Company', 'XYZ Roofing Services'},
+        2,
+        0,
+        id='one_place_fails_others_succeed'
+    ),
+    # Place Details returns nothing; business is created from text search data
+    pytest.param(
+        SINGLE_PLACE_SEARCH_RESULT,
+        [None],
+        {'ABC Roofing Company'},
+        1,
+        0,
+        id='place_details_returns_none'
+    ),
+]
+
+
+class TestPlaceDetailsScenarios:
+    """Test Place Details retries, failures and partial results."""
+    
+    @pytest.mark.parametrize(
+        "search_response, details_side_effect, expected_names, expected_place_calls, "
+        "expected_sleeps",
+        PLACE_DETAILS_SCENARIOS
+    )
+    def test_place_details_scenarios(
+        self,
+        mock_sleep,
+        patched_service,
+        search_response,
+        details_side_effect,
+        expected_names,
+        expected_place_calls,
+        expected_sleeps
+    ):
+        """Test that businesses survive Place Details errors, retrying rate limits."""
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': search_response,
+            'place.side_effect': details_side_effect
+        })
+        
+        businesses = service.search_businesses("roofing", "Austin", "TX")
+        
+        assert len(businesses) == len(expected_names)
+        assert {b.name for b in businesses} == expected_names
+        assert mock_client.place.call_count == expected_place_calls
+        assert mock_sleep.call_count == expected_sleeps
+        if expected_sleeps:
+            # First backoff: 0.5 second base plus up to 1 second of jitter
+            assert 0.5 <= mock_sleep.call_args_list[0][0][0] <= 1.5
 
 
-class TestRateLimitRetryLogic:
-    """Test rate limit retry logic."""
+class TestPlaceDetailsCache:
+    """Test persistent Place Details caching."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    @patch('time.sleep')
-    def test_rate_limit_retry_succeeds(self, mock_sleep, mock_client_class, mock_config):
-        """Test that rate limit retry succeeds."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        
-        # First call raises 429, retry succeeds
-        rate_limit_error = ApiError('Rate limit exceeded')
-        rate_limit_error.status = 429
-        mock_client.place.side_effect = [
-            rate_limit_error,
-            SAMPLE_PLACE_DETAILS_1
-        ]
+    def test_cached_details_skip_api_call(self, mock_client, tmp_path):
+        """Test that a second search reuses cached details instead of calling the API."""
+        config = _make_config(
+            place_details_cache_path=str(tmp_path / 'cache' / 'place_details.sqlite3'),
+            place_details_cache_ttl_days=7
+        )
+        
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
+        
+        service = GooglePlacesService(config)
+        first = service.search_businesses("roofing", "Austin", "TX")
+        second = service.search_businesses("roofing", "Austin", "TX")
+        
+        assert mock_client.place.call_count == 1
+        assert second[0].phone == first[0].phone == '+1-512-555-0123'
+    
+    def test_expired_details_are_refetched(self, mock_client, tmp_path):
+        """Test that entries older than the TTL are fetched again."""
+        config = _make_config(
+            place_details_cache_path=str(tmp_path / 'place_details.sqlite3'),
+            place_details_cache_ttl_days=0
+        )
+        
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
+        
+        service = GooglePlacesService(config)
+        service.search_businesses("roofing", "Austin", "TX")
+        service.search_businesses("roofing", "Austin", "TX")
         
-        service = GooglePlacesService(mock_config)
+        assert mock_client.place.call_count == 2
+    
+    def test_changed_fields_are_refetched(self, mock_client, tmp_path):
+        """Test that entries cached without Atmosphere fields are not served once they are requested."""
+        cache_path = str(tmp_path / 'place_details.sqlite3')
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
+        
+        for include_atmosphere in (False, True, True):
+            config = _make_config(
+                place_details_cache_path=cache_path,
+                place_details_include_atmosphere=include_atmosphere
+            )
+            service = GooglePlacesService(config)
+            service.search_businesses("roofing", "Austin", "TX")
+            service.close()
         
+        assert mock_client.place.call_count == 2
+    
+    @pytest.mark.parametrize("path_kind", ['parent_is_file', 'not_a_database'])
+    def test_unusable_cache_path_disables_cache(self, mock_client, tmp_path, path_kind):
+        """Test that a cache that cannot be opened is skipped instead of failing the service."""
+        blocker = tmp_path / 'blocker'
+        blocker.write_bytes(b'this is not a sqlite database' * 10)
+        cache_path = blocker / 'place_details.sqlite3' if path_kind == 'parent_is_file' else blocker
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
+        
+        service = GooglePlacesService(_make_config(place_details_cache_path=str(cache_path)))
         businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        # Should retry and succeed
-        assert len(businesses) == 1
-        # Should sleep for backoff (1.0 second)
-        assert mock_sleep.call_count >= 1
-        # Check that 1.0 second sleep was called for backoff
-        assert any(call[0][0] == 1.0 for call in mock_sleep.call_args_list)
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    @patch('time.sleep')
-    def test_rate_limit_retry_fails(self, mock_sleep, mock_client_class, mock_config):
-        """Test that rate limit retry failure is handled gracefully."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        
-        # Both calls fail with 429
-        rate_limit_error = ApiError('Rate limit exceeded')
-        rate_limit_error.status = 429
-        mock_client.place.side_effect = rate_limit_error
-        
-        service = GooglePlacesService(mock_config)
+        assert service.details_cache is None
+        assert businesses[0].phone == '+1-512-555-0123'
+    
+    def test_close_releases_connection(self, mock_client, tmp_path):
+        """Test that closing the service closes the cache database."""
+        config = _make_config(place_details_cache_path=str(tmp_path / 'place_details.sqlite3'))
+        service = GooglePlacesService(config)
+        cache = service.details_cache
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        service.close()
+        service.close()
         
-        # Should still create business from text search data
-        assert len(businesses) == 1
+        assert service.details_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get('ChIJN1t_tDeuEmsRUsoyG83frY4')
 
 
-class TestInvalidPlaceData:
-    """Test handling of invalid place data."""
+class TestPlaceDetailsFields:
+    """Test which Place Details fields are requested."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_missing_place_id(self, mock_client_class, mock_config):
-        """Test that place without place_id is skipped."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [
-                {
-                    'name': 'Valid Business',
-                    'place_id': 'valid_id',
-                    'formatted_address': '123 Test St',
-                    'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-                },
-                {
-                    'name': 'Invalid Business',
-                    # Missing place_id
-                    'formatted_address': '456 Test St',
-                    'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-                }
-            ]
-        }
-        mock_client.place.return_value = {
-            'result': {
-                'place_id': 'valid_id',
-                'name': 'Valid Business',
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-            }
-        }
+    def test_atmosphere_fields_optional(self, mock_client):
+        """Test that only contact fields are requested when Atmosphere data is disabled."""
+        config = _make_config(place_details_include_atmosphere=False)
         
-        service = GooglePlacesService(mock_config)
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        service = GooglePlacesService(config)
+        service.search_businesses("roofing", "Austin", "TX")
         
-        # Should only return valid business
-        assert len(businesses) == 1
-        assert businesses[0].name == 'Valid Business'
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_missing_name(self, mock_client_class, mock_config):
-        """Test that place without name is skipped."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [
-                {
-                    'place_id': 'no_name_id',
-                    # Missing name
-                    'formatted_address': '123 Test St',
-                    'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-                }
-            ]
-        }
-        mock_client.place.return_value = {
-            'result': {
-                'place_id': 'no_name_id',
-                # Missing name
-                'formatted_address': '123 Test St',
-                'geometry': {'location': {'lat': 30.0, 'lng': -97.0}}
-            }
+        fields = mock_client.place.call_args.kwargs['fields']
+        assert set(fields) == set(GooglePlacesService.CONTACT_FIELDS)
+    
+    def test_details_skipped_when_search_has_all_fields(self, mock_client):
+        """Test that no details call is made when text search already has every field."""
+        config = _make_config(place_details_include_atmosphere=False)
+        place = {
+            **SAMPLE_PLACE_SEARCH_RESULT['results'][0],
+            'international_phone_number': '+1-512-555-0123',
+            'formatted_phone_number': '(512) 555-0123',
+            'website': 'https://www.abcroofing.com'
         }
         
-        service = GooglePlacesService(mock_config)
+        mock_client.places.return_value = {'results': [place]}
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        service = GooglePlacesService(config)
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
-        # Should skip invalid place
-        assert len(businesses) == 0
+        mock_client.place.assert_not_called()
+        assert businesses[0].website_url == 'https://www.abcroofing.com'
+
+    
+    def test_v1_search_skips_details_calls(self, mocker, mock_client):
+        """Test that Places API (New) search results are used without Place Details calls."""
+        config = _make_config(google_places_use_v1_search=True)
+        mock_post = mocker.patch('src.services.google_places.requests.post')
+        mock_post.return_value = mocker.Mock(status_code=200, content=b"""{"places": [{
+            "id": "v1_place_id",
+            "displayName": {"text": "ABC Roofing Company"},
+            "formattedAddress": "123 Main St, Austin, TX 78701, USA",
+            "location": {"latitude": 30.2672, "longitude": -97.7431},
+            "types": ["roofing_contractor", "establishment"],
+            "businessStatus": "OPERATIONAL",
+            "internationalPhoneNumber": "+1 512-555-0123",
+            "websiteUri": "https://www.abcroofing.com/",
+            "rating": 4.5,
+            "priceLevel": "PRICE_LEVEL_MODERATE",
+            "reviews": [{
+                "authorAttribution": {"displayName": "John Doe"},
+                "rating": 5,
+                "text": {"text": "Great service!"},
+                "publishTime": "2021-01-01T00:00:00.123456789Z"
+            }]
+        }]}""")
+        
+        service = GooglePlacesService(config)
+        businesses = service.search_businesses("roofing", "Austin", "TX")
+        
+        mock_client.places.assert_not_called()
+        mock_client.place.assert_not_called()
+        business = businesses[0]
+        assert business.google_place_id == 'v1_place_id'
+        assert business.phone == '+1 512-555-0123'
+        assert business.website_url == 'https://www.abcroofing.com/'
+        assert business.price_level == 2
+        assert business.latitude == 30.2672
+        assert business.reviews[0]['time'] == 1609459200
 
 
 class TestTypeFiltering:
     """Test type filtering functionality."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_generic_types_filtered(self, mock_client_class, mock_config):
+    def test_generic_types_filtered(self, patched_service):
         """Test that generic types are filtered out."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
         
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         assert len(businesses) == 1
         # Should filter out 'establishment' and 'point_of_interest'
@@ -631,83 +859,35 @@ class TestTypeFiltering:
 class TestReviewSortingAndLimiting:
     """Test review sorting and limiting."""
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_reviews_limited_to_5(self, mock_client_class, mock_config):
+    def test_reviews_limited_to_5(self, patched_service):
         """Test that only 5 most recent reviews are included."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
-        
-        service = GooglePlacesService(mock_config)
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
         
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         assert len(businesses) == 1
         # Should have only 5 reviews (6 were provided)
         assert len(businesses[0].reviews) == 5
     
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_reviews_sorted_by_time(self, mock_client_class, mock_config):
+    def test_reviews_sorted_by_time(self, patched_service):
         """Test that reviews are sorted by time (most recent first)."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [SAMPLE_PLACE_SEARCH_RESULT['results'][0]]
-        }
-        mock_client.place.return_value = SAMPLE_PLACE_DETAILS_1
+        service, mock_client = patched_service
+        mock_client.configure_mock(**{
+            'places.return_value': SINGLE_PLACE_SEARCH_RESULT,
+            'place.return_value': SAMPLE_PLACE_DETAILS_1
+        })
         
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
+        businesses = service.search_businesses("roofing", "Austin", "TX")
         
         assert len(businesses) == 1
-        reviews = businesses[0].reviews
+        times = [review['time'] for review in businesses[0].reviews]
         
         # Verify reviews are sorted by time (descending)
-        for i in range(len(reviews) - 1):
-            assert reviews[i]['time'] >= reviews[i + 1]['time']
+        assert times == sorted(times, reverse=True)
         
         # Most recent should be first
-        assert reviews[0]['time'] == 1609459200  # Most recent
-
-
-class TestPartialFailureHandling:
-    """Test partial failure handling."""
-    
-    @patch('src.services.google_places.googlemaps.Client')
-    def test_one_place_fails_others_succeed(self, mock_client_class, mock_config):
-        """Test that one failing place doesn't stop processing of others."""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.places.return_value = {
-            'results': [
-                SAMPLE_PLACE_SEARCH_RESULT['results'][0],
-                SAMPLE_PLACE_SEARCH_RESULT['results'][1]
-            ]
-        }
-        
-        # First place details fails, second succeeds
-        def place_side_effect(place_id, **kwargs):
-            if place_id == 'ChIJN1t_tDeuEmsRUsoyG83frY4':
-                raise Exception("Place details error")
-            return SAMPLE_PLACE_DETAILS_2
-        
-        mock_client.place.side_effect = place_side_effect
-        
-        service = GooglePlacesService(mock_config)
-        
-        with patch('time.sleep'):
-            businesses = service.search_businesses("roofing", "Austin", "TX")
-        
-        # Should still return both businesses (first from text search, second with details)
-        # When place details fails, business is still created from text search data
-        assert len(businesses) == 2
-        # Verify both businesses are present
-        business_names = {b.name for b in businesses}
-        assert 'ABC Roofing Company' in business_names
-        assert 'XYZ Roofing Services' in business_names
+        assert times[0] == 1609459200  # Most recent
@@ -0,0 +1,106 @@
+"""Unit tests for the website checker's DNS pre-check."""
+
+import socket
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import website_checker
+from src.services.website_checker import WebsiteCheckerService, _host_resolves
+
+
+@pytest.fixture(autouse=True)
+def clear_dns_cache():
+    """Start every test with an empty DNS cache."""
+    website_checker._dns_cache.clear()
+    yield
+    website_checker._dns_cache.clear()
+
+
+@pytest.fixture
+def mock_getaddrinfo(mocker):
+    """Replace socket.getaddrinfo as seen by the checker."""
+    return mocker.patch('src.services.website_checker.socket.getaddrinfo')
+
+
+@pytest.fixture
+def checker(mocker):
+    """Create a WebsiteCheckerService whose session never touches the network."""
+    service = WebsiteCheckerService(SimpleNamespace())
+    mocker.patch.object(service, 'session')
+    service.session.head.return_value = SimpleNamespace(status_code=200, history=[])
+    return service
+
+
+@pytest.fixture
+def no_proxies(monkeypatch):
+    """Make sure no proxy environment variables are set."""
+    for name in ('HTTP_PROXY', 'HTTPS_PROXY', 'ALL_PROXY', 'http_proxy', 'https_proxy', 'all_proxy'):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestHostResolves:
+    """Test _host_resolves caching and error classification."""
+    
+    def test_resolving_host_is_cached(self, mock_getaddrinfo):
+        """Test that a successful lookup is remembered."""
+        assert _host_resolves('example.com') is True
+        assert _host_resolves('example.com') is True
+        
+        assert mock_getaddrinfo.call_count == 1
+    
+    def test_unknown_host_is_cached_negative(self, mock_getaddrinfo):
+        """Test that EAI_NONAME means the host does not resolve, and is remembered."""
+        mock_getaddrinfo.side_effect = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        
+        assert _host_resolves('no-such-host.invalid') is False
+        assert _host_resolves('no-such-host.invalid') is False
+        
+        assert mock_getaddrinfo.call_count == 1
+    
+    def test_temporary_failure_is_not_negative(self, mock_getaddrinfo):
+        """Test that EAI_AGAIN counts as resolving and is not cached."""
+        mock_getaddrinfo.side_effect = socket.gaierror(socket.EAI_AGAIN, 'Temporary failure')
+        
+        assert _host_resolves('example.com') is True
+        assert 'example.com' not in website_checker._dns_cache
+        
+        mock_getaddrinfo.side_effect = None
+        assert _host_resolves('example.com') is True
+        assert mock_getaddrinfo.call_count == 2
+
+
+class TestVerifyUrlDnsPrecheck:
+    """Test how verify_url_accessibility uses the DNS pre-check."""
+    
+    def test_unresolvable_host_skips_http(self, no_proxies, mock_getaddrinfo, checker):
+        """Test that no HTTP request is made for a host that does not exist."""
+        mock_getaddrinfo.side_effect = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        
+        assert checker.verify_url_accessibility('https://no-such-host.invalid') is False
+        checker.session.head.assert_not_called()
+    
+    def test_temporary_dns_failure_still_checks_http(self, no_proxies, mock_getaddrinfo, checker):
+        """Test that a temporary DNS failure leaves the decision to the HTTP request."""
+        mock_getaddrinfo.side_effect = socket.gaierror(socket.EAI_AGAIN, 'Temporary failure')
+        
+        assert checker.verify_url_accessibility('https://example.com') is True
+        checker.session.head.assert_called_once()
+    
+    def test_proxy_skips_dns_precheck(self, monkeypatch, mock_getaddrinfo, checker):
+        """Test that the local lookup is skipped when a proxy resolves names."""
+        monkeypatch.setenv('HTTPS_PROXY', 'http://proxy.internal:3128')
+        monkeypatch.delenv('NO_PROXY', raising=False)
+        monkeypatch.delenv('no_proxy', raising=False)
+        mock_getaddrinfo.side_effect = socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        
+        assert checker.verify_url_accessibility('https://example.com') is True
+        mock_getaddrinfo.assert_not_called()
+        checker.session.head.assert_called_once()
+    
+    def test_scheme_less_url_is_checked(self, no_proxies, mock_getaddrinfo, checker):
+        """Test that a URL without a scheme is normalized and requested."""
+        assert checker.verify_url_accessibility('example.com') is True
+        
+        mock_getaddrinfo.assert_called_once()
+        assert checker.session.head.call_args.args[0] == 'https://example.com'
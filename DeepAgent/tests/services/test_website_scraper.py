@@ -0,0 +1,153 @@
+"""Unit tests for website scraper content extraction."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.website_scraper import WebsiteScraperService, _parse_and_extract
+
+
+PAGE_URL = 'https://www.abcroofing.com/about'
+
+SAMPLE_PAGE = b"""<!DOCTYPE html>
+<html>
+<head>
+    <title> ABC Roofing | Austin Roofers </title>
+    <meta name="description" content="Trusted roofing in Austin since 1999.">
+    <meta name="keywords" content="roofing, repair , , austin">
+    <style>p { color: red; }</style>
+</head>
+<body>
+    <header><h1>ABC Roofing</h1><a href="/header-link">Header</a></header>
+    <nav><a href="/services">Services</a></nav>
+    <main>
+        <h2>Our Services</h2>
+        <h3>Roof Repair</h3>
+        <h2>Why Us</h2>
+        <p>We fix <b>roofs</b> fast.</p>
+        <p>   </p>
+        <p>Call today<script>trackCall();</script>.</p>
+        <a href="/contact">Contact us</a>
+        <a href="/contact">Contact again</a>
+        <a href="https://www.abcroofing.com/gallery">Gallery</a>
+        <a href="https://other-site.com/page">External</a>
+        <a href="mailto:info@abcroofing.com">Email</a>
+        <a href="/empty"></a>
+        <img src="roof.jpg" alt="New shingle roof">
+        <img src="blank.jpg">
+    </main>
+    <footer><p>Footer text</p><img src="logo.png" alt="Logo"></footer>
+</body>
+</html>"""
+
+
+@pytest.fixture(scope="module")
+def extracted():
+    """Content extracted from the sample page."""
+    return _parse_and_extract(SAMPLE_PAGE, PAGE_URL, 5000)
+
+
+class TestContentExtraction:
+    """Test the fields extracted from a parsed page."""
+    
+    def test_title_and_meta(self, extracted):
+        """Test that title, description and keywords are extracted and cleaned."""
+        assert extracted['url'] == PAGE_URL
+        assert extracted['title'] == 'ABC Roofing | Austin Roofers'
+        assert extracted['meta_description'] == 'Trusted roofing in Austin since 1999.'
+        assert extracted['meta_keywords'] == ['roofing', 'repair', 'austin']
+    
+    def test_headings_grouped_by_level(self, extracted):
+        """Test that headings come back as h1s, then h2s, then h3s, including the header's."""
+        assert extracted['headings'] == ['ABC Roofing', 'Our Services', 'Why Us', 'Roof Repair']
+    
+    def test_paragraphs_skip_boilerplate_and_scripts(self, extracted):
+        """Test that footer paragraphs and inline script text are left out."""
+        assert extracted['content'] == 'We fix roofs fast. Call today.'
+    
+    def test_links_internal_deduplicated_in_order(self, extracted):
+        """Test that only internal links with text outside nav/header are kept, once each."""
+        assert extracted['links'] == [
+            'https://www.abcroofing.com/contact',
+            'https://www.abcroofing.com/gallery'
+        ]
+    
+    def test_images_use_alt_text(self, extracted):
+        """Test that alt text is collected from content images only."""
+        assert extracted['images'] == ['New shingle roof']
+    
+    def test_structure_summary(self, extracted):
+        """Test the page structure summary."""
+        assert extracted['structure'] == {
+            'has_nav': True,
+            'has_footer': True,
+            'has_header': True,
+            'heading_count': 4,
+            'paragraph_count': 3,
+            'link_count': 2,
+            'image_count': 1,
+        }
+    
+    def test_content_truncated(self):
+        """Test that paragraph text is cut at max_content_length."""
+        page = b'<html><body><p>' + b'a' * 50 + b'</p></body></html>'
+        
+        assert _parse_and_extract(page, PAGE_URL, 10)['content'] == 'a' * 10 + '...'
+    
+    @pytest.mark.parametrize("page", [b'', b'<!-- comment only -->'], ids=['empty', 'comment_only'])
+    def test_unparseable_page_yields_empty_content(self, page):
+        """Test that pages lxml rejects still produce an empty result."""
+        extracted = _parse_and_extract(page, PAGE_URL, 5000)
+        
+        assert extracted['title'] == ''
+        assert extracted['content'] == ''
+
+
+class TestEncoding:
+    """Test how page bytes are decoded."""
+    
+    TEXT = 'Café — “best” roofing'
+    
+    def test_utf8_without_declared_charset(self):
+        """Test that UTF-8 pages without any charset are not read as Latin-1."""
+        page = f'<p>{self.TEXT}</p>'.encode('utf-8')
+        
+        assert _parse_and_extract(page, PAGE_URL, 5000)['content'] == self.TEXT
+    
+    def test_header_charset_used(self):
+        """Test that the Content-Type charset decodes the body."""
+        page = '<p>Café</p>'.encode('iso-8859-1')
+        
+        assert _parse_and_extract(page, PAGE_URL, 5000, 'iso-8859-1')['content'] == 'Café'
+    
+    def test_meta_charset_used(self):
+        """Test that <meta charset> decodes the body when the header has none."""
+        page = f'<meta charset="windows-1252"><p>{self.TEXT}</p>'.encode('cp1252')
+        
+        assert _parse_and_extract(page, PAGE_URL, 5000)['content'] == self.TEXT
+    
+    def test_xml_declaration(self):
+        """Test that XHTML pages with an encoding declaration still parse."""
+        page = (
+            '<?xml version="1.0" encoding="iso-8859-1"?>'
+            '<html><body><p>Café</p></body></html>'
+        ).encode('iso-8859-1')
+        
+        assert _parse_and_extract(page, PAGE_URL, 5000)['content'] == 'Café'
+    
+    def test_scrape_passes_header_charset(self, mocker):
+        """Test that scrape_website_content decodes with the response's charset."""
+        service = WebsiteScraperService(SimpleNamespace(
+            website_scraper_max_workers=1,
+            website_scraper_parse_processes=0
+        ))
+        response = mocker.MagicMock(
+            status_code=200,
+            headers={'Content-Type': 'text/html; charset=ISO-8859-1'},
+            url=PAGE_URL
+        )
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b'<p>Caf', 'é</p>'.encode('iso-8859-1')]
+        mocker.patch.object(service, 'session').get.return_value = response
+        
+        assert service.scrape_website_content(PAGE_URL)['content'] == 'Café'
@@ -0,0 +1,61 @@
+"""Unit tests for configuration loading and caching."""
+
+import pytest
+
+from src.utils.config import clear_config_cache, get_config
+
+
+@pytest.fixture(autouse=True)
+def clean_config(monkeypatch):
+    """Provide the required keys and start and end every test with an empty cache."""
+    monkeypatch.setenv('GOOGLE_PLACES_API_KEY', 'test_places_key')
+    monkeypatch.setenv('OPENAI_API_KEY', 'test_openai_key')
+    monkeypatch.setenv('LLM_PROVIDER', 'openai')
+    # Set then delete so values loaded from .env files are removed afterwards
+    monkeypatch.setenv('LLM_MODEL', 'unset')
+    monkeypatch.delenv('LLM_MODEL')
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    """Path to a .env file in a temporary directory."""
+    return tmp_path / '.env'
+
+
+class TestConfigCache:
+    """Test get_config caching and clear_config_cache."""
+    
+    def test_instance_reused_per_env_file(self, env_file):
+        """Test that get_config returns the same instance for the same env_file."""
+        env_file.write_text('')
+        
+        assert get_config(str(env_file)) is get_config(str(env_file))
+    
+    def test_clear_rereads_environment(self, monkeypatch, env_file):
+        """Test that environment changes are picked up only after clearing the cache."""
+        env_file.write_text('')
+        monkeypatch.setenv('GOOGLE_PLACES_MAX_RESULTS', '5')
+        config = get_config(str(env_file))
+        
+        monkeypatch.setenv('GOOGLE_PLACES_MAX_RESULTS', '7')
+        assert get_config(str(env_file)).google_places_max_results == 5
+        
+        clear_config_cache()
+        reloaded = get_config(str(env_file))
+        
+        assert reloaded is not config
+        assert reloaded.google_places_max_results == 7
+    
+    def test_clear_rereads_env_file(self, monkeypatch, env_file):
+        """Test that a .env file is loaded again after clearing the cache."""
+        env_file.write_text('LLM_MODEL=gpt-4o\n')
+        assert get_config(str(env_file)).llm_model == 'gpt-4o'
+        
+        env_file.write_text('LLM_MODEL=gpt-4o-mini\n')
+        monkeypatch.delenv('LLM_MODEL')
+        clear_config_cache()
+        
+        assert get_config(str(env_file)).llm_model == 'gpt-4o-mini'
@@ -0,0 +1,29 @@
+"""Unit tests for shared HTTP session helpers."""
+
+from urllib3 import HTTPResponse
+
+from src.utils.http import create_session
+
+
+class TestCreateSession:
+    """Test the retry policy of sessions from create_session."""
+    
+    def test_retry_after_header_ignored(self, mocker):
+        """Test that a long Retry-After from a site does not make a worker sleep for it."""
+        mock_sleep = mocker.patch('urllib3.util.retry.time.sleep')
+        retry = create_session('test-agent').get_adapter('https://example.com').max_retries
+        response = HTTPResponse(status=429, headers={'Retry-After': '3600'})
+        
+        retry = retry.increment(method='GET', url='/', response=response)
+        retry.sleep(response)
+        
+        assert all(call.args[0] < 60 for call in mock_sleep.call_args_list)
+        assert retry.respect_retry_after_header is False
+    
+    def test_transient_statuses_still_retried(self):
+        """Test that 429 and 5xx responses are still retried."""
+        retry = create_session('test-agent').get_adapter('https://example.com').max_retries
+        
+        assert retry.is_retry('GET', 429, has_retry_after=True)
+        assert retry.is_retry('GET', 503)
+        assert not retry.is_retry('GET', 404)